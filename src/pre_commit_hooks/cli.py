@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import utilities.click
+from click import echo, group
+from utilities.click import CONTEXT_SETTINGS, ListStrs, argument, option
+
+from pre_commit_hooks.click import paths_argument
+from pre_commit_hooks.daemon import PATH_DAEMON_SOCKET, serve
+from pre_commit_hooks.fleet import run_fleet
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@group(**CONTEXT_SETTINGS)
+def _main() -> None: ...
+
+
+@_main.command(**CONTEXT_SETTINGS)
+@option("--socket", type=utilities.click.Path(), default=PATH_DAEMON_SOCKET)
+def daemon(*, socket: Path) -> None:
+    serve(socket_=socket)
+
+
+@_main.command(**CONTEXT_SETTINGS)
+@argument("repos", nargs=-1, type=utilities.click.Path())
+@option("--hooks", type=ListStrs(), default=None)
+def fleet(*, repos: tuple[Path, ...], hooks: list[str] | None) -> None:
+    results = run_fleet(*repos, hooks=hooks)
+    for result in results:
+        echo(result.summary())
+    if not all(r.ok for r in results):
+        raise SystemExit(1)
+
+
+@_main.command(**CONTEXT_SETTINGS)
+def list_templates() -> None:
+    from pre_commit_hooks.templates import list_templates
+
+    for name, text in list_templates().items():
+        echo(f"# {name}\n{text.rstrip()}\n")
+
+
+@_main.command(**CONTEXT_SETTINGS)
+@paths_argument
+@option("--hooks", type=ListStrs(), default=None)
+@option("--max-workers", type=int, default=None)
+def python(
+    *, paths: tuple[Path, ...], hooks: list[str] | None, max_workers: int | None
+) -> None:
+    from pre_commit_hooks.hooks import (
+        add_future_import_annotations,
+        replace_sequence_str,
+    )
+    from pre_commit_hooks.utilities import run_python_transforms
+
+    all_transforms = {
+        "add-future-import-annotations": add_future_import_annotations.TRANSFORM,
+        "replace-sequence-str": replace_sequence_str.TRANSFORM,
+    }
+    hooks_use = list(all_transforms) if hooks is None else hooks
+    modifications: set[Path] = set()
+    run_python_transforms(
+        *paths,
+        transforms=[all_transforms[h] for h in hooks_use],
+        modifications=modifications,
+        max_workers=max_workers,
+    )
+    if len(modifications) >= 1:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    _main()
@@ -1,43 +1,70 @@
 from __future__ import annotations
 
 import utilities.click
-from utilities.click import ListStrs, SecretStr, Str, argument, flag, option
+from utilities.click import ListStrs, SecretStr, Str, TimeDelta, argument, flag, option
+from utilities.constants import HOUR
 
+action_mirrors_option = option(
+    "--action-mirrors", type=utilities.click.Path(), default=None
+)
+action_snapshot_option = option(
+    "--action-snapshot", type=utilities.click.Path(), default=None
+)
+action_versions_option = option("--action-versions", type=ListStrs(), default=None)
+action_versions_ttl_option = option(
+    "--action-versions-ttl", type=TimeDelta(), default=24 * HOUR
+)
+cache_flag = flag("--cache", default=True)
 certificates_flag = flag("--certificates", default=False)
 description_option = option("--description", type=Str(), default=None)
+force_lock_flag = flag("--force-lock", default=False)
 gitea_flag = flag("--gitea", default=False)
 index_option = option("--index", type=ListStrs(), default=None)
 index_name_option = option("--index-name", type=Str(), default=None)
 index_password_option = option("--index-password", type=SecretStr(), default=None)
 index_username_option = option("--index-username", type=Str(), default=None)
+lock_ttl_option = option("--lock-ttl", type=TimeDelta(), default=HOUR)
 native_tls_flag = flag("--native-tls", default=False)
 package_name_option = option("--package-name", type=Str(), default=None)
+parallel_flag = flag("--parallel", default=False)
 paths_argument = argument("paths", nargs=-1, type=utilities.click.Path())
 python_flag = flag("--python", default=False)
 python_version_option = option("--python-version", type=Str(), default=None)
+refresh_flag = flag("--refresh", default=False)
 repo_name_option = option("--repo-name", type=Str(), default=None)
 throttle_flag = flag("--throttle", default=True)
 token_checkout_option = option("--token-checkout", type=SecretStr(), default=None)
 token_github_option = option("--token-github", type=SecretStr(), default=None)
 version_option = option("--version", type=Str(), default=None)
+version_set_ttl_option = option("--version-set-ttl", type=TimeDelta(), default=HOUR)
 
 
 __all__ = [
+    "action_mirrors_option",
+    "action_snapshot_option",
+    "action_versions_option",
+    "action_versions_ttl_option",
+    "cache_flag",
     "certificates_flag",
     "description_option",
+    "force_lock_flag",
     "gitea_flag",
     "index_name_option",
     "index_option",
     "index_password_option",
     "index_username_option",
+    "lock_ttl_option",
     "native_tls_flag",
     "package_name_option",
+    "parallel_flag",
     "paths_argument",
     "python_flag",
     "python_version_option",
+    "refresh_flag",
     "repo_name_option",
     "throttle_flag",
     "token_checkout_option",
     "token_github_option",
     "version_option",
+    "version_set_ttl_option",
 ]
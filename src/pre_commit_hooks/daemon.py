@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import traceback
+from contextlib import contextmanager, suppress
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pre_commit_hooks import __version__
+from pre_commit_hooks.constants import PATH_CACHE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from click import Command
+
+
+PATH_DAEMON_SOCKET = PATH_CACHE / f"daemon-{__version__}.sock"
+_FDS = (1, 2)
+_TIMEOUT_CONNECT = 1.0
+_TIMEOUT_RESPONSE = 600.0
+
+
+##
+
+
+def main() -> None:
+    hook = Path(sys.argv[0]).stem
+    raise SystemExit(run_hook(hook, sys.argv[1:]))
+
+
+def run_hook(
+    hook: str,
+    args: Sequence[str],
+    /,
+    *,
+    socket_: Path = PATH_DAEMON_SOCKET,
+    timeout: float = _TIMEOUT_RESPONSE,
+) -> int:
+    try:
+        return _request(hook, args, socket_=socket_, timeout=timeout)
+    except _DaemonUnavailableError:
+        return run_in_process(hook, args)
+    except _DaemonResponseError as error:
+        print(error, file=sys.stderr)  # noqa: T201
+        return 1
+
+
+def _request(
+    hook: str, args: Sequence[str], /, *, socket_: Path, timeout: float
+) -> int:
+    if not (hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")):
+        raise _DaemonUnavailableError
+    if not socket_.exists():
+        raise _DaemonUnavailableError
+    payload = {
+        "hook": hook,
+        "args": list(args),
+        "cwd": str(Path.cwd()),
+        "env": dict(os.environ),
+        "version": __version__,
+    }
+    _ = sys.stdout.flush()
+    _ = sys.stderr.flush()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_TIMEOUT_CONNECT)
+        try:
+            sock.connect(str(socket_))
+        except OSError:
+            raise _DaemonUnavailableError from None
+        sock.settimeout(timeout)
+        try:
+            _ = socket.send_fds(sock, [b"\0"], list(_FDS))
+            sock.sendall(json.dumps(payload).encode())
+            sock.shutdown(socket.SHUT_WR)
+            data = _recv_all(sock)
+        except OSError as error:
+            msg = f"Daemon at {str(socket_)!r} failed to respond: {error}"
+            raise _DaemonResponseError(msg) from None
+    try:
+        response: dict[str, Any] = json.loads(data)
+        if response.get("error") == "version":
+            raise _DaemonUnavailableError
+        return int(response["code"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        msg = f"Daemon at {str(socket_)!r} sent an invalid response: {data!r}"
+        raise _DaemonResponseError(msg) from None
+
+
+def run_in_process(hook: str, args: Sequence[str], /) -> int:
+    command = _get_command(hook)
+    try:
+        command.main(args=list(args), prog_name=hook)
+    except SystemExit as error:
+        return _exit_code(error)
+    return 0
+
+
+class _DaemonResponseError(Exception): ...
+
+
+class _DaemonUnavailableError(Exception): ...
+
+
+##
+
+
+def serve(*, socket_: Path = PATH_DAEMON_SOCKET) -> None:
+    _warm_up()
+    socket_.parent.mkdir(parents=True, exist_ok=True)
+    with suppress(FileNotFoundError):
+        socket_.unlink()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_))
+        server.listen()
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn, suppress(OSError, KeyError, ValueError):
+                    _handle(conn)
+        finally:
+            with suppress(FileNotFoundError):
+                socket_.unlink()
+
+
+def _warm_up() -> None:
+    hooks = Path(__file__).parent / "hooks"
+    for path in sorted(hooks.glob("*.py")):
+        if path.stem != "__init__":
+            _ = import_module(f"pre_commit_hooks.hooks.{path.stem}")
+
+
+def _handle(conn: socket.socket, /) -> None:
+    _, fds, _, _ = socket.recv_fds(conn, 1, len(_FDS))
+    try:
+        payload: dict[str, Any] = json.loads(_recv_all(conn))
+        if payload["version"] != __version__:
+            response: dict[str, Any] = {"error": "version"}
+        else:
+            with _yield_request_context(fds, cwd=payload["cwd"], env=payload["env"]):
+                code = _run_in_process_safe(payload["hook"], payload["args"])
+            response = {"code": code}
+    finally:
+        for fd in fds:
+            os.close(fd)
+    conn.sendall(json.dumps(response).encode())
+
+
+def _run_in_process_safe(hook: str, args: Sequence[str], /) -> int:
+    try:
+        return run_in_process(hook, args)
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        return 1
+
+
+@contextmanager
+def _yield_request_context(
+    fds: Sequence[int], /, *, cwd: str, env: dict[str, str]
+) -> Iterator[None]:
+    _ = sys.stdout.flush()
+    _ = sys.stderr.flush()
+    saved_fds = [os.dup(fd) for fd in _FDS]
+    saved_cwd = Path.cwd()
+    saved_env = dict(os.environ)
+    for src, dest in zip(fds, _FDS, strict=True):
+        _ = os.dup2(src, dest)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        _ = sys.stdout.flush()
+        _ = sys.stderr.flush()
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+        for saved, dest in zip(saved_fds, _FDS, strict=True):
+            _ = os.dup2(saved, dest)
+            os.close(saved)
+
+
+##
+
+
+def _get_command(hook: str, /) -> Command:
+    module = import_module(f"pre_commit_hooks.hooks.{hook.replace('-', '_')}")
+    return module._main  # noqa: SLF001
+
+
+def _exit_code(error: SystemExit, /) -> int:
+    match error.code:
+        case None:
+            return 0
+        case int() as code:
+            return code
+        case message:
+            print(message, file=sys.stderr)  # noqa: T201
+            return 1
+
+
+def _recv_all(sock: socket.socket, /) -> bytes:
+    chunks: list[bytes] = []
+    while chunk := sock.recv(1 << 16):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+__all__ = ["PATH_DAEMON_SOCKET", "main", "run_hook", "run_in_process", "serve"]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import traceback
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from re import search
+from subprocess import CalledProcessError, check_output
+from typing import TYPE_CHECKING
+
+from utilities.core import read_text, yield_temp_cwd
+from utilities.importlib import files
+
+from pre_commit_hooks.constants import DYCW_PRE_COMMIT_HOOKS_URL, PRE_COMMIT_CONFIG_YAML
+from pre_commit_hooks.daemon import run_in_process
+from pre_commit_hooks.utilities import load_yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from utilities.types import PathLike, StrDict
+
+
+_TYPES: dict[str, str] = {"python": r"\.pyi?$"}
+
+
+##
+
+
+def run_fleet(
+    *repos: PathLike, hooks: Sequence[str] | None = None
+) -> list[FleetResult]:
+    return [_run_repo(Path(r).resolve(), hooks=hooks) for r in repos]
+
+
+@dataclass(kw_only=True, slots=True)
+class FleetResult:
+    repo: Path
+    modified: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return (len(self.modified) == 0) and (len(self.errors) == 0)
+
+    def summary(self) -> str:
+        if self.ok:
+            return f"{self.repo}: ok"
+        parts = [f"modified {', '.join(self.modified)}"] if self.modified else []
+        parts.extend(f"{h} failed: {e}" for h, e in self.errors.items())
+        return f"{self.repo}: {'; '.join(parts)}"
+
+
+def _run_repo(repo: Path, /, *, hooks: Sequence[str] | None = None) -> FleetResult:
+    result = FleetResult(repo=repo)
+    with yield_temp_cwd(repo):
+        try:
+            hooks_use = _get_hooks(hooks=hooks)
+        except Exception:  # noqa: BLE001
+            result.errors["fleet"] = traceback.format_exc(limit=1).strip()
+            return result
+        for hook, args in hooks_use:
+            try:
+                code = run_in_process(hook, [*args, *_get_files(hook)])
+            except Exception:  # noqa: BLE001
+                result.errors[hook] = traceback.format_exc(limit=1).strip()
+            else:
+                if code != 0:
+                    result.modified.append(hook)
+    return result
+
+
+def _get_hooks(*, hooks: Sequence[str] | None = None) -> list[tuple[str, list[str]]]:
+    config: StrDict = load_yaml(PRE_COMMIT_CONFIG_YAML.read_text()) or {}
+    return [
+        (hook["id"], list(map(str, hook.get("args", []))))
+        for repo in config.get("repos", [])
+        if repo.get("repo") == DYCW_PRE_COMMIT_HOOKS_URL
+        for hook in repo.get("hooks", [])
+        if (hooks is None) or (hook["id"] in hooks)
+    ]
+
+
+def _get_files(hook: str, /) -> list[str]:
+    definition = _get_definitions()[hook]
+    if not definition.get("pass_filenames", True):
+        return []
+    pattern: str = definition.get("files", "")
+    types: list[str] = definition.get("types", [])
+    try:
+        text = check_output(["git", "ls-files"], text=True)
+    except CalledProcessError:
+        return []
+    return [
+        p
+        for p in text.splitlines()
+        if search(pattern, p) and all(search(_TYPES[t], p) for t in types)
+    ]
+
+
+@cache
+def _get_definitions() -> dict[str, StrDict]:
+    path = files(anchor="pre_commit_hooks") / "configs" / "pre-commit-hooks.yaml"
+    return {d["id"]: d for d in load_yaml(read_text(path))}
+
+
+__all__ = ["FleetResult", "run_fleet"]
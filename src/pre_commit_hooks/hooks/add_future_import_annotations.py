@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from codecs import BOM_UTF8
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,15 +14,17 @@ from utilities.throttle import throttle
 
 from pre_commit_hooks.click import paths_argument, throttle_flag
 from pre_commit_hooks.utilities import (
+    PythonTransform,
     path_throttle_cache,
     run_all_maybe_raise,
-    yield_python_file,
+    run_python_transforms,
 )
 
 if TYPE_CHECKING:
     from collections.abc import MutableSet
     from pathlib import Path
 
+    from libcst import Module
     from utilities.types import PathLike
 
 
@@ -31,27 +34,42 @@ if TYPE_CHECKING:
 def _main(*, paths: tuple[Path, ...], throttle: bool) -> None:
     if is_pytest():
         return
-    run_all_maybe_raise(*(partial(_run, p, throttle=throttle) for p in paths))
+    run_all_maybe_raise(partial(_run, *paths, throttle=throttle))
 
 
-def _run(path: PathLike, /, *, throttle: bool = True) -> bool:
+def _run(*paths: PathLike, throttle: bool = True) -> bool:
     modifications: set[Path] = set()
     func = _run_throttled if throttle else _run_unthrottled
-    func(path, modifications=modifications)
+    func(*paths, modifications=modifications)
     return len(modifications) == 0
 
 
 def _run_unthrottled(
-    path: PathLike, /, *, modifications: MutableSet[Path] | None = None
+    *paths: PathLike, modifications: MutableSet[Path] | None = None
 ) -> None:
-    with yield_python_file(path, modifications=modifications) as context:
-        if len(context.input.body) == 0:
-            body = [parse_statement("from __future__ import annotations")]
-            context.output = context.input.with_changes(body=body)
+    run_python_transforms(*paths, transforms=[TRANSFORM], modifications=modifications)
+
+
+def _transform(module: Module, /) -> Module:
+    if len(module.body) == 0:
+        body = [parse_statement("from __future__ import annotations")]
+        return module.with_changes(body=body)
+    return module
+
+
+def _prefilter(data: bytes, /) -> bool:
+    lines = data.removeprefix(BOM_UTF8).splitlines()
+    return all(
+        (line.strip() == b"") or line.lstrip().startswith(b"#") for line in lines
+    )
+
+
+TRANSFORM = PythonTransform(func=_transform, prefilter=_prefilter)
 
 
 _run_throttled = throttle(
-    duration=6 * HOUR, path=path_throttle_cache("add-future-import-annotations")
+    duration=6 * HOUR,
+    path=partial(path_throttle_cache, "add-future-import-annotations"),
 )(_run_unthrottled)
 
 
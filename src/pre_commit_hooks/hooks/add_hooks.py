@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, assert_never, overload
@@ -17,6 +19,7 @@ from utilities.click import (
     to_args,
 )
 from utilities.core import is_pytest
+from utilities.functions import ensure_class
 from utilities.types import PathLike
 
 from pre_commit_hooks.click import (
@@ -37,8 +40,6 @@ from pre_commit_hooks.constants import (
     LOCAL,
     PRE_COMMIT_CONFIG_YAML,
     PRE_COMMIT_PRIORITY,
-    PYPROJECT_TOML,
-    PYTEST_TOML,
     RUFF_URL,
     SHELLCHECK_URL,
     SHFMT_URL,
@@ -48,6 +49,8 @@ from pre_commit_hooks.constants import (
     XMLFORMATTER_URL,
 )
 from pre_commit_hooks.utilities import (
+    TrackedDict,
+    add_modification,
     ensure_contains,
     ensure_contains_partial_dict,
     get_set_list_dicts,
@@ -59,9 +62,9 @@ from pre_commit_hooks.utilities import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, MutableSet
+    from collections.abc import Callable, Iterator, MutableSet
 
-    from utilities.types import MaybeSequenceStr, PathLike, SecretLike
+    from utilities.types import MaybeSequenceStr, PathLike, SecretLike, StrDict
 
 
 @command(**CONTEXT_SETTINGS)
@@ -262,207 +265,218 @@ def _run(
     toml: bool = False,
     xml: bool = False,
 ) -> bool:
-    funcs: list[Callable[[], bool]] = [
-        partial(_add_check_versions_consistent, path=path),
-        partial(_add_format_pre_commit_config, path=path),
-        partial(_add_format_pytest, path=path),
-        partial(_add_run_prek_autoupdate, path=path),
-        partial(_add_run_version_bump, path=path),
-        partial(_add_setup_bump_my_version, path=path),
-        partial(_add_setup_git, path=path, python=python),
-        partial(_add_setup_pre_commit, path=path),
-        partial(
-            _add_setup_readme, path=path, repo_name=repo_name, description=description
-        ),
-        partial(_add_standard_hooks, path=path),
-    ]
-    ci_github_or_gitea: dict[Literal["github", "gitea"], bool] = {}
-    if ci_github:
-        ci_github_or_gitea["github"] = False
-    if ci_gitea:
-        ci_github_or_gitea["gitea"] = True
-    if len(ci_github_or_gitea) >= 1:
-        funcs.append(partial(_add_update_ci_action_versions, path=path))
-        funcs.append(partial(_add_update_ci_extensions, path=path))
-    for gitea in ci_github_or_gitea.values():
-        funcs.append(
-            partial(
-                _add_setup_ci_push,
-                path=path,
-                gitea=gitea,
-                certificates=certificates,
-                token_checkout=ci_token_checkout,
-                token_github=ci_token_github,
-                tag_user_name=ci_tag_user_name,
-                tag_user_email=ci_tag_user_email,
-                tag_major_minor=ci_tag_all,
-                tag_major=ci_tag_all,
-                tag_latest=ci_tag_all,
-                package=python,
-                package_job_name_suffix=ci_package_job_name_suffix,
-                package_username=python_index_username,
-                package_password=ci_python_index_password_write,
-                package_publish_url=python_index_url,
-                package_trusted_publishing=ci_package_trusted_publishing,
-                image=ci_image,
-                image_runs_on=ci_image_runs_on,
-                image_registry_host=ci_image_registry_host,
-                image_registry_port=ci_image_registry_port,
-                image_registry_username=ci_image_registry_username,
-                image_registry_password=ci_image_registry_password,
-                image_namespace=ci_image_namespace,
-                image_uv_index=_to_read_url(python_index_url),
-                image_uv_index_username=python_index_username,
-                image_uv_index_password=ci_python_index_password_read,
-            )
-        )
-        funcs.append(
+    with yield_yaml_dict(path) as dict_:
+        session = _Session(path=Path(path), dict_=ensure_class(dict_, TrackedDict))
+        funcs: list[Callable[[], bool]] = [
+            partial(_add_check_versions_consistent, session=session),
+            partial(_add_format_pre_commit_config, session=session),
+            partial(_add_format_pytest, session=session),
+            partial(_add_run_prek_autoupdate, session=session),
+            partial(_add_run_version_bump, session=session),
+            partial(_add_setup_bump_my_version, session=session),
+            partial(_add_setup_git, session=session, python=python),
+            partial(_add_setup_pre_commit, session=session),
             partial(
-                _add_setup_ci_pull_request,
-                path=path,
-                set_up=python,
-                gitea=gitea,
+                _add_setup_readme,
+                session=session,
                 repo_name=repo_name,
-                certificates=certificates,
-                token_checkout=ci_token_checkout,
-                token_github=ci_token_github,
-                index=_to_read_url(python_index_url),
-                index_username=python_index_username,
-                index_password=ci_python_index_password_read,
-                python_version=python_version,
-                pyright_resolution=ci_pyright_resolution,
-                pyright_prerelease=ci_pyright_prerelease,
-                pytest_runs_on=ci_pytest_runs_on,
-                pytest_sops_age_key=ci_pytest_sops_age_key,
-                pytest_os=ci_pytest_os,
-                pytest_python_version=ci_pytest_python_version,
+                description=description,
+            ),
+            partial(_add_standard_hooks, session=session),
+        ]
+        ci_github_or_gitea: dict[Literal["github", "gitea"], bool] = {}
+        if ci_github:
+            ci_github_or_gitea["github"] = False
+        if ci_gitea:
+            ci_github_or_gitea["gitea"] = True
+        if len(ci_github_or_gitea) >= 1:
+            funcs.append(partial(_add_update_ci_action_versions, session=session))
+            funcs.append(partial(_add_update_ci_extensions, session=session))
+        for gitea in ci_github_or_gitea.values():
+            funcs.append(
+                partial(
+                    _add_setup_ci_push,
+                    session=session,
+                    gitea=gitea,
+                    certificates=certificates,
+                    token_checkout=ci_token_checkout,
+                    token_github=ci_token_github,
+                    tag_user_name=ci_tag_user_name,
+                    tag_user_email=ci_tag_user_email,
+                    tag_major_minor=ci_tag_all,
+                    tag_major=ci_tag_all,
+                    tag_latest=ci_tag_all,
+                    package=python,
+                    package_job_name_suffix=ci_package_job_name_suffix,
+                    package_username=python_index_username,
+                    package_password=ci_python_index_password_write,
+                    package_publish_url=python_index_url,
+                    package_trusted_publishing=ci_package_trusted_publishing,
+                    image=ci_image,
+                    image_runs_on=ci_image_runs_on,
+                    image_registry_host=ci_image_registry_host,
+                    image_registry_port=ci_image_registry_port,
+                    image_registry_username=ci_image_registry_username,
+                    image_registry_password=ci_image_registry_password,
+                    image_namespace=ci_image_namespace,
+                    image_uv_index=_to_read_url(python_index_url),
+                    image_uv_index_username=python_index_username,
+                    image_uv_index_password=ci_python_index_password_read,
+                )
             )
-        )
-    if direnv and not python:
-        funcs.append(partial(_add_setup_direnv, path=path, version=python_version))
-    if docker:
-        funcs.append(partial(_add_dockerfmt, path=path))
-    if fish:
-        funcs.append(partial(_add_fish_indent, path=path))
-    if just:
-        funcs.append(partial(_add_setup_just, path=path))
-    if lua:
-        funcs.append(partial(_add_stylua, path=path))
-    if prettier:
-        funcs.append(partial(_add_prettier, path=path))
-    if python:
-        funcs.append(partial(_add_add_future_import_annotations, path=path))
-        funcs.append(partial(_add_format_requirements, path=path))
-        funcs.append(partial(_add_replace_sequence_str, path=path))
-        funcs.append(partial(_add_ruff_check, path=path))
-        funcs.append(partial(_add_ruff_format, path=path))
-        funcs.append(
-            partial(
-                _add_run_uv_lock,
-                path=path,
-                index=_to_read_url(python_index_url),
-                index_username=python_index_username,
-                index_password=python_index_password,
-                native_tls=certificates,
+            funcs.append(
+                partial(
+                    _add_setup_ci_pull_request,
+                    session=session,
+                    set_up=python,
+                    gitea=gitea,
+                    repo_name=repo_name,
+                    certificates=certificates,
+                    token_checkout=ci_token_checkout,
+                    token_github=ci_token_github,
+                    index=_to_read_url(python_index_url),
+                    index_username=python_index_username,
+                    index_password=ci_python_index_password_read,
+                    python_version=python_version,
+                    pyright_resolution=ci_pyright_resolution,
+                    pyright_prerelease=ci_pyright_prerelease,
+                    pytest_runs_on=ci_pytest_runs_on,
+                    pytest_sops_age_key=ci_pytest_sops_age_key,
+                    pytest_os=ci_pytest_os,
+                    pytest_python_version=ci_pytest_python_version,
+                )
             )
-        )
-        funcs.append(
-            partial(
-                _add_setup_bump_my_version,
-                path=path,
-                package_name=python_package_name_internal,
+        if direnv and not python:
+            funcs.append(
+                partial(_add_setup_direnv, session=session, version=python_version)
             )
-        )
-        funcs.append(partial(_add_setup_coverage, path=path))
-        funcs.append(
-            partial(
-                _add_setup_direnv,
-                path=path,
-                python=True,
-                index_name=python_index_name,
-                index_username=python_index_username,
-                index_password=python_index_password,
-                native_tls=certificates,
-                version=python_version,
+        if docker:
+            funcs.append(partial(_add_dockerfmt, session=session))
+        if fish:
+            funcs.append(partial(_add_fish_indent, session=session))
+        if just:
+            funcs.append(partial(_add_setup_just, session=session))
+        if lua:
+            funcs.append(partial(_add_stylua, session=session))
+        if prettier:
+            funcs.append(partial(_add_prettier, session=session))
+        if python:
+            funcs.append(partial(_add_add_future_import_annotations, session=session))
+            funcs.append(partial(_add_format_requirements, session=session))
+            funcs.append(partial(_add_replace_sequence_str, session=session))
+            funcs.append(partial(_add_ruff_check, session=session))
+            funcs.append(partial(_add_ruff_format, session=session))
+            funcs.append(
+                partial(
+                    _add_run_uv_lock,
+                    session=session,
+                    index=_to_read_url(python_index_url),
+                    index_username=python_index_username,
+                    index_password=python_index_password,
+                    native_tls=certificates,
+                )
             )
-        )
-        funcs.append(
-            partial(
-                _add_setup_pyproject,
-                path=path,
-                version=python_version,
-                description=description,
-                index_name=python_index_name,
-                index_url=_to_read_url(python_index_url),
-                name_external=python_package_name_external,
-                name_internal=python_package_name_internal,
+            funcs.append(
+                partial(
+                    _add_setup_bump_my_version,
+                    session=session,
+                    package_name=python_package_name_internal,
+                )
             )
-        )
-        funcs.append(partial(_add_setup_pyright, path=path, version=python_version))
-        funcs.append(
-            partial(
-                _add_setup_pytest, path=path, package_name=python_package_name_internal
+            funcs.append(partial(_add_setup_coverage, session=session))
+            funcs.append(
+                partial(
+                    _add_setup_direnv,
+                    session=session,
+                    python=True,
+                    index_name=python_index_name,
+                    index_username=python_index_username,
+                    index_password=python_index_password,
+                    native_tls=certificates,
+                    version=python_version,
+                )
             )
-        )
-        funcs.append(partial(_add_setup_ruff, path=path, version=python_version))
-        funcs.append(
-            partial(
-                _add_update_requirements,
-                path=path,
-                index=_to_read_url(python_index_url),
-                index_username=python_index_username,
-                index_password=python_index_password,
-                native_tls=certificates,
+            funcs.append(
+                partial(
+                    _add_setup_pyproject,
+                    session=session,
+                    version=python_version,
+                    description=description,
+                    index_name=python_index_name,
+                    index_url=_to_read_url(python_index_url),
+                    name_external=python_package_name_external,
+                    name_internal=python_package_name_internal,
+                )
             )
-        )
-    if shell:
-        funcs.append(partial(_add_shellcheck, path=path))
-        funcs.append(partial(_add_shfmt, path=path))
-    if toml:
-        funcs.append(partial(_add_taplo_format, path=path))
-    if xml:
-        funcs.append(partial(_add_xmlformatter, path=path))
-    return run_all(*funcs)
+            funcs.append(
+                partial(_add_setup_pyright, session=session, version=python_version)
+            )
+            funcs.append(
+                partial(
+                    _add_setup_pytest,
+                    session=session,
+                    package_name=python_package_name_internal,
+                )
+            )
+            funcs.append(
+                partial(_add_setup_ruff, session=session, version=python_version)
+            )
+            funcs.append(
+                partial(
+                    _add_update_requirements,
+                    session=session,
+                    index=_to_read_url(python_index_url),
+                    index_username=python_index_username,
+                    index_password=python_index_password,
+                    native_tls=certificates,
+                )
+            )
+        if shell:
+            funcs.append(partial(_add_shellcheck, session=session))
+            funcs.append(partial(_add_shfmt, session=session))
+        if toml:
+            funcs.append(partial(_add_taplo_format, session=session))
+        if xml:
+            funcs.append(partial(_add_xmlformatter, session=session))
+        return run_all(*funcs)
 
 
 ##
 
 
-def _add_add_future_import_annotations(
-    *, path: PathLike = PRE_COMMIT_CONFIG_YAML
-) -> bool:
+def _add_add_future_import_annotations(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "add-future-import-annotations",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
     return len(modifications) == 0
 
 
-def _add_check_versions_consistent(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_check_versions_consistent(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "check-versions-consistent",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="linter",
     )
     return len(modifications) == 0
 
 
-def _add_dockerfmt(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_dockerfmt(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DOCKERFMT_URL,
         "dockerfmt",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=["--newline", "--write"],
         type_="formatter",
@@ -470,13 +484,13 @@ def _add_dockerfmt(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
     return len(modifications) == 0
 
 
-def _add_fish_indent(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_fish_indent(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         LOCAL,
         "fish_indent",
-        path=path,
         modifications=modifications,
+        session=session,
         name="fish_indent",
         entry="fish_indent",
         language="unsupported",
@@ -487,52 +501,52 @@ def _add_fish_indent(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
     return len(modifications) == 0
 
 
-def _add_format_pre_commit_config(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_format_pre_commit_config(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "format-pre-commit-config",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="formatter",
     )
     return len(modifications) == 0
 
 
-def _add_format_pytest(*, path: PathLike = PYTEST_TOML) -> bool:
+def _add_format_pytest(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "format-pytest",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="formatter",
     )
     return len(modifications) == 0
 
 
-def _add_format_requirements(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_format_requirements(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "format-requirements",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="formatter",
     )
     return len(modifications) == 0
 
 
-def _add_prettier(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_prettier(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         LOCAL,
         "prettier",
-        path=path,
         modifications=modifications,
+        session=session,
         name="prettier",
         entry="npx prettier --write",
         language="unsupported",
@@ -542,26 +556,26 @@ def _add_prettier(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
     return len(modifications) == 0
 
 
-def _add_replace_sequence_str(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_replace_sequence_str(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "replace-sequence-str",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
     return len(modifications) == 0
 
 
-def _add_run_prek_autoupdate(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_run_prek_autoupdate(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "run-prek-autoupdate",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="pre-commit",
     )
@@ -570,7 +584,7 @@ def _add_run_prek_autoupdate(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool
 
 def _add_run_uv_lock(
     *,
-    path: PathLike = PYPROJECT_TOML,
+    session: _Session,
     index: MaybeSequenceStr | None = None,
     index_username: str | None = None,
     index_password: SecretLike | None = None,
@@ -591,8 +605,8 @@ def _add_run_uv_lock(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "run-uv-lock",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -600,13 +614,13 @@ def _add_run_uv_lock(
     return len(modifications) == 0
 
 
-def _add_ruff_check(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_ruff_check(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         RUFF_URL,
         "ruff-check",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=["--fix"],
         type_="editor",
@@ -614,26 +628,26 @@ def _add_ruff_check(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
     return len(modifications) == 0
 
 
-def _add_ruff_format(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_ruff_format(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         RUFF_URL,
         "ruff-format",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="formatter",
     )
     return len(modifications) == 0
 
 
-def _add_run_version_bump(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_run_version_bump(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "run-version-bump",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
@@ -641,15 +655,15 @@ def _add_run_version_bump(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
 
 
 def _add_setup_bump_my_version(
-    *, path: PathLike = PRE_COMMIT_CONFIG_YAML, package_name: str | None = None
+    *, session: _Session, package_name: str | None = None
 ) -> bool:
     modifications: set[Path] = set()
     args: list[str] = to_args("--package-name", package_name, join=True)
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-bump-my-version",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -659,7 +673,7 @@ def _add_setup_bump_my_version(
 
 def _add_setup_ci_pull_request(
     *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
+    session: _Session,
     set_up: bool = False,
     gitea: bool = False,
     repo_name: str | None = None,
@@ -716,8 +730,8 @@ def _add_setup_ci_pull_request(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-ci-pull-request",
-        path=path,
         modifications=modifications,
+        session=session,
         args=args if len(args) >= 1 else None,
         rev=True,
         type_="editor",
@@ -727,7 +741,7 @@ def _add_setup_ci_pull_request(
 
 def _add_setup_ci_push(
     *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
+    session: _Session,
     gitea: bool = False,
     certificates: bool = False,
     token_checkout: SecretLike | None = None,
@@ -820,8 +834,8 @@ def _add_setup_ci_push(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-ci-push",
-        path=path,
         modifications=modifications,
+        session=session,
         args=args if len(args) >= 1 else None,
         rev=True,
         type_="editor",
@@ -829,13 +843,13 @@ def _add_setup_ci_push(
     return len(modifications) == 0
 
 
-def _add_setup_coverage(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_setup_coverage(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-coverage",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
@@ -844,7 +858,7 @@ def _add_setup_coverage(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
 
 def _add_setup_direnv(
     *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
+    session: _Session,
     python: bool = False,
     index_name: str | None = None,
     index_username: str | None = None,
@@ -871,8 +885,8 @@ def _add_setup_direnv(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-direnv",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -880,16 +894,14 @@ def _add_setup_direnv(
     return len(modifications) == 0
 
 
-def _add_setup_git(
-    *, path: PathLike = PRE_COMMIT_CONFIG_YAML, python: bool = False
-) -> bool:
+def _add_setup_git(*, session: _Session, python: bool = False) -> bool:
     modifications: set[Path] = set()
     args: list[str] = to_args("--python", python, join=True)
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-git",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -897,26 +909,26 @@ def _add_setup_git(
     return len(modifications) == 0
 
 
-def _add_setup_just(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_setup_just(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-just",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
     return len(modifications) == 0
 
 
-def _add_setup_pre_commit(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_setup_pre_commit(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-pre-commit",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="pre-commit",
     )
@@ -925,7 +937,7 @@ def _add_setup_pre_commit(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
 
 def _add_setup_pyproject(
     *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
+    session: _Session,
     version: str | None = None,
     description: str | None = None,
     index_name: str | None = None,
@@ -952,8 +964,8 @@ def _add_setup_pyproject(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-pyproject",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -961,16 +973,14 @@ def _add_setup_pyproject(
     return len(modifications) == 0
 
 
-def _add_setup_pyright(
-    *, path: PathLike = PRE_COMMIT_CONFIG_YAML, version: str | None = None
-) -> bool:
+def _add_setup_pyright(*, session: _Session, version: str | None = None) -> bool:
     modifications: set[Path] = set()
     args: list[str] = to_args("--version", version, join=True)
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-pyright",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -978,16 +988,14 @@ def _add_setup_pyright(
     return len(modifications) == 0
 
 
-def _add_setup_pytest(
-    *, path: PathLike = PRE_COMMIT_CONFIG_YAML, package_name: str | None = None
-) -> bool:
+def _add_setup_pytest(*, session: _Session, package_name: str | None = None) -> bool:
     modifications: set[Path] = set()
     args: list[str] = to_args("--package-name", package_name, join=True)
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-pytest",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -996,10 +1004,7 @@ def _add_setup_pytest(
 
 
 def _add_setup_readme(
-    *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
-    repo_name: str | None = None,
-    description: str | None = None,
+    *, session: _Session, repo_name: str | None = None, description: str | None = None
 ) -> bool:
     modifications: set[Path] = set()
     args: list[str] = to_args(
@@ -1008,8 +1013,8 @@ def _add_setup_readme(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-readme",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -1017,16 +1022,14 @@ def _add_setup_readme(
     return len(modifications) == 0
 
 
-def _add_setup_ruff(
-    *, path: PathLike = PRE_COMMIT_CONFIG_YAML, version: str | None = None
-) -> bool:
+def _add_setup_ruff(*, session: _Session, version: str | None = None) -> bool:
     modifications: set[Path] = set()
     args: list[str] = to_args("--version", version, join=True)
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "setup-ruff",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -1034,148 +1037,168 @@ def _add_setup_ruff(
     return len(modifications) == 0
 
 
-def _add_shellcheck(*, path: PathLike = PYPROJECT_TOML) -> bool:
+def _add_shellcheck(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         SHELLCHECK_URL,
         "shellcheck",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="linter",
     )
     return len(modifications) == 0
 
 
-def _add_shfmt(*, path: PathLike = PYPROJECT_TOML) -> bool:
+def _add_shfmt(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         SHFMT_URL,
         "shfmt",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="formatter",
     )
     return len(modifications) == 0
 
 
-def _add_standard_hooks(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_standard_hooks(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         BUILTIN,
         "check-added-large-files",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
         BUILTIN,
         "check-case-conflict",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
         BUILTIN,
         "check-executables-have-shebangs",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
-        BUILTIN, "check-json", path=path, modifications=modifications, type_="linter"
+        BUILTIN,
+        "check-json",
+        modifications=modifications,
+        session=session,
+        type_="linter",
     )
     _add_hook(
-        BUILTIN, "check-json5", path=path, modifications=modifications, type_="linter"
+        BUILTIN,
+        "check-json5",
+        modifications=modifications,
+        session=session,
+        type_="linter",
     )
     _add_hook(
         BUILTIN,
         "check-merge-conflict",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
         BUILTIN,
         "check-symlinks",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
-        BUILTIN, "check-toml", path=path, modifications=modifications, type_="linter"
+        BUILTIN,
+        "check-toml",
+        modifications=modifications,
+        session=session,
+        type_="linter",
     )
     _add_hook(
-        BUILTIN, "check-xml", path=path, modifications=modifications, type_="linter"
+        BUILTIN,
+        "check-xml",
+        modifications=modifications,
+        session=session,
+        type_="linter",
     )
     _add_hook(
-        BUILTIN, "check-yaml", path=path, modifications=modifications, type_="linter"
+        BUILTIN,
+        "check-yaml",
+        modifications=modifications,
+        session=session,
+        type_="linter",
     )
     _add_hook(
         BUILTIN,
         "detect-private-key",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
         BUILTIN,
         "end-of-file-fixer",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="editor",
     )
     _add_hook(
         BUILTIN,
         "fix-byte-order-marker",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="editor",
     )
     _add_hook(
         BUILTIN,
         "mixed-line-ending",
-        path=path,
         modifications=modifications,
+        session=session,
         args=["--fix=lf"],
         type_="editor",
     )
     _add_hook(
         BUILTIN,
         "no-commit-to-branch",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="linter",
     )
     _add_hook(
         BUILTIN,
         "trailing-whitespace",
-        path=path,
         modifications=modifications,
+        session=session,
         type_="editor",
     )
     _add_hook(
         STD_PRE_COMMIT_HOOKS_URL,
         "check-illegal-windows-names",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="linter",
     )
     _add_hook(
         STD_PRE_COMMIT_HOOKS_URL,
         "destroyed-symlinks",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="linter",
     )
     _add_hook(
         STD_PRE_COMMIT_HOOKS_URL,
         "pretty-format-json",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=["--autofix"],
         type_="editor",
@@ -1183,26 +1206,26 @@ def _add_standard_hooks(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
     return len(modifications) == 0
 
 
-def _add_stylua(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_stylua(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         STYLUA_URL,
         "stylua",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="formatter",
     )
     return len(modifications) == 0
 
 
-def _add_taplo_format(*, path: PathLike = PYPROJECT_TOML) -> bool:
+def _add_taplo_format(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         TAPLO_URL,
         "taplo-format",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=[
             "--option=indent_tables=true",
@@ -1214,26 +1237,26 @@ def _add_taplo_format(*, path: PathLike = PYPROJECT_TOML) -> bool:
     return len(modifications) == 0
 
 
-def _add_update_ci_action_versions(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_update_ci_action_versions(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "update-ci-action-versions",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
     return len(modifications) == 0
 
 
-def _add_update_ci_extensions(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+def _add_update_ci_extensions(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "update-ci-extensions",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         type_="editor",
     )
@@ -1242,7 +1265,7 @@ def _add_update_ci_extensions(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> boo
 
 def _add_update_requirements(
     *,
-    path: PathLike = PYPROJECT_TOML,
+    session: _Session,
     index: MaybeSequenceStr | None = None,
     index_username: str | None = None,
     index_password: SecretLike | None = None,
@@ -1263,8 +1286,8 @@ def _add_update_requirements(
     _add_hook(
         DYCW_PRE_COMMIT_HOOKS_URL,
         "update-requirements",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         args=args if len(args) >= 1 else None,
         type_="editor",
@@ -1272,13 +1295,13 @@ def _add_update_requirements(
     return len(modifications) == 0
 
 
-def _add_xmlformatter(*, path: PathLike = PYPROJECT_TOML) -> bool:
+def _add_xmlformatter(*, session: _Session) -> bool:
     modifications: set[Path] = set()
     _add_hook(
         XMLFORMATTER_URL,
         "xml-formatter",
-        path=path,
         modifications=modifications,
+        session=session,
         rev=True,
         types=[],
         types_or=["plist", "xml"],
@@ -1296,7 +1319,7 @@ def _add_hook(
     id_: str,
     /,
     *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
+    session: _Session,
     modifications: MutableSet[Path] | None = None,
     rev: bool = False,
     name: str | None = None,
@@ -1308,7 +1331,7 @@ def _add_hook(
     args: list[str] | None = None,
     type_: Literal["pre-commit", "editor", "formatter", "linter"] | None = None,
 ) -> None:
-    with yield_yaml_dict(path, modifications=modifications) as dict_:
+    with session.yield_dict(modifications=modifications) as dict_:
         repos = get_set_list_dicts(dict_, "repos")
         repo = ensure_contains_partial_dict(repos, {"repo": url})
         if rev:
@@ -1323,9 +1346,9 @@ def _add_hook(
             hook["language"] = language
         if files is not None:
             hook["files"] = files
-        if types is not None:
+        if (types is not None) and (hook.get("types") != types):
             hook["types"] = types
-        if types_or is not None:
+        if (types_or is not None) and (hook.get("types_or") != types_or):
             hook["types_or"] = types_or
         if (args is not None) and (len(args) >= 1):
             args_list = get_set_list_strs(hook, "args")
@@ -1346,6 +1369,24 @@ def _add_hook(
         re_insert_hook_dict(hook, repo)
 
 
+@dataclass(kw_only=True, slots=True)
+class _Session:
+    path: Path
+    dict_: TrackedDict
+
+    @contextmanager
+    def yield_dict(
+        self, *, modifications: MutableSet[Path] | None = None
+    ) -> Iterator[StrDict]:
+        n = len(self.dict_.tracker.changes)
+        yield self.dict_
+        if len(self.dict_.tracker.changes) > n:
+            add_modification(self.path, modifications=modifications)
+
+
+##
+
+
 @overload
 def _to_read_url(url: None, /) -> None: ...
 @overload
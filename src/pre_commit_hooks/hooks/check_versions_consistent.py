@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from functools import partial
-from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
 
 from click import command
 from utilities.click import CONTEXT_SETTINGS
 from utilities.core import is_pytest
+from utilities.subprocess import RunError
 
 from pre_commit_hooks.click import paths_argument
 from pre_commit_hooks.constants import BUMPVERSION_TOML
@@ -36,7 +36,7 @@ def _run(*, path: PathLike = BUMPVERSION_TOML) -> bool:
     version = get_version_from_path(path=path)
     try:
         set_version(version, path=path)
-    except CalledProcessError:
+    except (RunError, ValueError):
         return False
     return True
 
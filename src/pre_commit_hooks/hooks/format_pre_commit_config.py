@@ -20,6 +20,7 @@ from pre_commit_hooks.utilities import (
     re_insert_dict,
     re_insert_hook_dict,
     run_all_maybe_raise,
+    run_formatters,
     yield_yaml_dict,
 )
 
@@ -48,6 +49,7 @@ def _run(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
             hooks.sort(key=_sort_hooks)
             for hook in hooks:
                 re_insert_hook_dict(hook, repo)
+    run_formatters()
     return read_text(path) == init
 
 
@@ -9,7 +9,7 @@ from utilities.click import CONTEXT_SETTINGS
 from utilities.core import is_pytest, read_text
 from utilities.types import PathLike
 
-from pre_commit_hooks.click import paths_argument
+from pre_commit_hooks.click import cache_flag, paths_argument
 from pre_commit_hooks.constants import PYTEST_TOML
 from pre_commit_hooks.utilities import (
     get_table,
@@ -17,6 +17,8 @@ from pre_commit_hooks.utilities import (
     re_insert_array,
     re_insert_table,
     run_all_maybe_raise,
+    run_cached,
+    run_formatters,
     yield_toml_doc,
 )
 
@@ -28,11 +30,23 @@ if TYPE_CHECKING:
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
-def _main(*, paths: tuple[Path, ...]) -> None:
+@cache_flag
+def _main(*, paths: tuple[Path, ...], cache: bool) -> None:
     if is_pytest():
         return
     paths_use = merge_paths(*paths, target=PYTEST_TOML)
-    run_all_maybe_raise(*(partial(_run, path=p) for p in paths_use))
+    run_all_maybe_raise(
+        *(
+            partial(
+                run_cached,
+                partial(_run, path=p),
+                name="format-pytest",
+                path=p,
+                cache=cache,
+            )
+            for p in paths_use
+        )
+    )
 
 
 def _run(*, path: PathLike = PYTEST_TOML) -> bool:
@@ -43,6 +57,7 @@ def _run(*, path: PathLike = PYTEST_TOML) -> bool:
         for value in pytest.values():
             if isinstance(value, Array):
                 re_insert_array(value)
+    run_formatters()
     return read_text(path) == init
 
 
@@ -13,7 +13,7 @@ from utilities.functions import ensure_str
 from utilities.packaging import Requirement
 from utilities.types import PathLike
 
-from pre_commit_hooks.click import paths_argument
+from pre_commit_hooks.click import parallel_flag, paths_argument
 from pre_commit_hooks.constants import PYPROJECT_TOML
 from pre_commit_hooks.utilities import (
     get_pyproject_dependencies,
@@ -30,10 +30,13 @@ if TYPE_CHECKING:
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
-def _main(*, paths: tuple[Path, ...]) -> None:
+@parallel_flag
+def _main(*, paths: tuple[Path, ...], parallel: bool) -> None:
     if is_pytest():
         return
-    run_all_maybe_raise(*(partial(_run, path=p) for p in paths))
+    run_all_maybe_raise(
+        *((partial(_run, path=p), [p]) for p in paths), parallel=parallel
+    )
 
 
 def _run(*, path: PathLike = PYPROJECT_TOML) -> bool:
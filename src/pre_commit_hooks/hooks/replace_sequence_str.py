@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import partial
+from re import search
 from typing import TYPE_CHECKING, override
 
 from click import command
@@ -10,12 +11,15 @@ from libcst.matchers import Name as MName
 from libcst.matchers import Subscript as MSubscript
 from libcst.matchers import SubscriptElement as MSubscriptElement
 from libcst.matchers import matches
-from libcst.metadata import MetadataWrapper
 from utilities.click import CONTEXT_SETTINGS
 from utilities.core import is_pytest
 
 from pre_commit_hooks.click import paths_argument
-from pre_commit_hooks.utilities import run_all_maybe_raise, yield_python_file
+from pre_commit_hooks.utilities import (
+    PythonTransform,
+    run_all_maybe_raise,
+    run_python_transforms,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -28,15 +32,12 @@ if TYPE_CHECKING:
 def _main(*, paths: tuple[Path, ...]) -> None:
     if is_pytest():
         return
-    run_all_maybe_raise(*(partial(_run, p) for p in paths))
+    run_all_maybe_raise(partial(_run, *paths))
 
 
-def _run(path: PathLike, /) -> bool:
+def _run(*paths: PathLike) -> bool:
     modifications: set[Path] = set()
-    with yield_python_file(path, modifications=modifications) as context:
-        context.output = MetadataWrapper(context.input).module.visit(
-            SequenceToListTransformer()
-        )
+    run_python_transforms(*paths, transforms=[TRANSFORM], modifications=modifications)
     return len(modifications) == 0
 
 
@@ -57,5 +58,12 @@ class SequenceToListTransformer(CSTTransformer):
         return updated_node
 
 
+def _prefilter(data: bytes, /) -> bool:
+    return (search(rb"\bSequence\b", data) is not None) and (b"str" in data)
+
+
+TRANSFORM = PythonTransform(transformer=SequenceToListTransformer, prefilter=_prefilter)
+
+
 if __name__ == "__main__":
     _main()
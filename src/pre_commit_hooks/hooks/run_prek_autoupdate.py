@@ -49,7 +49,7 @@ def _run_unthrottled(*, modifications: MutableSet[Path] | None = None) -> None:
 
 
 _run_throttled = throttle(
-    duration=6 * HOUR, path=path_throttle_cache("run-prek-autoupdate")
+    duration=6 * HOUR, path=partial(path_throttle_cache, "run-prek-autoupdate")
 )(_run_unthrottled)
 
 
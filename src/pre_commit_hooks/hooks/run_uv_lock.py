@@ -1,45 +1,62 @@
 from __future__ import annotations
 
+import json
+from contextlib import suppress
 from functools import partial
+from hashlib import blake2b
+from pathlib import Path
+from time import time
+from tomllib import TOMLDecodeError
 from typing import TYPE_CHECKING
 
 from click import command
+from packaging.utils import canonicalize_name
 from tomlkit import TOMLDocument, array, string
 from utilities.click import CONTEXT_SETTINGS
-from utilities.constants import MINUTE
-from utilities.core import is_pytest
+from utilities.constants import HOUR, MINUTE
+from utilities.core import (
+    ReadTextError,
+    always_iterable,
+    duration_to_seconds,
+    is_pytest,
+    read_text,
+    write_text,
+)
 from utilities.packaging import Requirement
 from utilities.subprocess import uv_lock, uv_sync
 from utilities.throttle import throttle
+from utilities.version import ParseVersion2Or3Error, parse_version_2_or_3
 
 from pre_commit_hooks.click import (
+    force_lock_flag,
     index_option,
     index_password_option,
     index_username_option,
+    lock_ttl_option,
     native_tls_flag,
     paths_argument,
 )
-from pre_commit_hooks.constants import PYPROJECT_TOML
+from pre_commit_hooks.constants import PATH_CACHE, PYPROJECT_TOML
 from pre_commit_hooks.utilities import (
+    get_dict,
     get_set_array,
     get_set_table,
     get_table,
-    get_version_set,
     merge_paths,
     path_throttle_cache,
+    read_toml_dict,
     run_all_maybe_raise,
     uv_index_credentials,
     yield_toml_doc,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, MutableSet
-    from pathlib import Path
+    from collections.abc import Callable, Iterable, Mapping
 
     from tomlkit.items import Array
-    from utilities.types import MaybeSequenceStr, PathLike, SecretLike
-
-    from pre_commit_hooks.types import VersionSet
+    from utilities.types import Duration, MaybeSequenceStr, PathLike, SecretLike
+    from utilities.version import Version2Or3
+    from whenever import TimeDelta
 
 
 @command(**CONTEXT_SETTINGS)
@@ -48,6 +65,8 @@ if TYPE_CHECKING:
 @index_username_option
 @index_password_option
 @native_tls_flag
+@force_lock_flag
+@lock_ttl_option
 def _main(
     *,
     paths: tuple[Path, ...],
@@ -55,20 +74,22 @@ def _main(
     index_username: str | None,
     index_password: SecretLike | None,
     native_tls: bool,
+    force_lock: bool,
+    lock_ttl: TimeDelta,
 ) -> None:
     if is_pytest():
         return
     paths_use = merge_paths(*paths, target=PYPROJECT_TOML)
-    versions = get_version_set(index=index, native_tls=native_tls)
     funcs: list[Callable[[], bool]] = [
         partial(
             _run,
             path=p,
-            versions=versions,
             index=index,
             index_username=index_username,
             index_password=index_password,
             native_tls=native_tls,
+            force_lock=force_lock,
+            lock_ttl=lock_ttl,
         )
         for p in paths_use
     ]
@@ -79,98 +100,67 @@ def _run(
     *,
     throttle: bool = True,
     path: PathLike = PYPROJECT_TOML,
-    versions: VersionSet | None = None,
     index: MaybeSequenceStr | None = None,
     index_username: str | None = None,
     index_password: SecretLike | None = None,
     native_tls: bool = False,
+    force_lock: bool = False,
+    lock_ttl: Duration = HOUR,
 ) -> bool:
-    modifications: set[Path] = set()
     func = _run_throttled if throttle else _run_unthrottled
     func(
         path=path,
-        modifications=modifications,
-        versions=versions,
         index=index,
         index_username=index_username,
         index_password=index_password,
         native_tls=native_tls,
+        force_lock=force_lock,
+        lock_ttl=lock_ttl,
     )
-    return len(modifications) == 0
+    return True
 
 
 def _run_unthrottled(
     *,
     path: PathLike = PYPROJECT_TOML,
-    modifications: MutableSet[Path] | None = None,
-    versions: VersionSet | None = None,
-    index: MaybeSequenceStr | None = None,
-    index_username: str | None = None,
-    index_password: SecretLike | None = None,
-    native_tls: bool = False,
-) -> None:
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        try:
-            project = get_table(doc, "project")
-        except KeyError:
-            _lock_and_sync(index=index, native_tls=native_tls)
-        else:
-            if "scripts" in project:
-                _pin_dependencies(
-                    path,
-                    versions=versions,
-                    index=index,
-                    index_username=index_username,
-                    index_password=index_password,
-                    native_tls=native_tls,
-                )
-            else:
-                _lock_and_sync(index=index, native_tls=native_tls)
-
-
-_run_throttled = throttle(duration=5 * MINUTE, path=path_throttle_cache("run-uv-lock"))(
-    _run_unthrottled
-)
-
-
-def _pin_dependencies(
-    path: PathLike = PYPROJECT_TOML,
-    /,
-    *,
-    versions: VersionSet | None = None,
     index: MaybeSequenceStr | None = None,
     index_username: str | None = None,
     index_password: SecretLike | None = None,
     native_tls: bool = False,
+    force_lock: bool = False,
+    lock_ttl: Duration = HOUR,
 ) -> None:
-    with yield_toml_doc(path) as doc:
-        cli = _get_cli(doc)
-        cli.clear()
+    try:
+        project = get_dict(read_toml_dict(path), "project")
+    except (FileNotFoundError, KeyError):
+        pin = False
+    else:
+        pin = "scripts" in project
     _lock_and_sync(
+        path=path,
         index=index,
         index_username=index_username,
         index_password=index_password,
         native_tls=native_tls,
+        pin=pin,
+        force=force_lock,
+        ttl=lock_ttl,
     )
+
+
+_run_throttled = throttle(
+    duration=5 * MINUTE, path=partial(path_throttle_cache, "run-uv-lock")
+)(_run_unthrottled)
+
+
+def _pin_dependencies(path: PathLike = PYPROJECT_TOML, /, *, lock: PathLike) -> None:
+    versions = _get_locked_versions(lock)
     with yield_toml_doc(path) as doc:
         project = get_table(doc, "project")
         dependencies = get_set_array(project, "dependencies")
-        pinned = _get_pinned(
-            dependencies,
-            versions=versions,
-            index=index,
-            index_username=index_username,
-            index_password=index_password,
-            native_tls=native_tls,
-        )
         cli = _get_cli(doc)
-        cli.extend(pinned)
-    _lock_and_sync(
-        index=index,
-        index_username=index_username,
-        index_password=index_password,
-        native_tls=native_tls,
-    )
+        cli.clear()
+        cli.extend(_get_pinned(dependencies, versions=versions))
 
 
 def _get_cli(doc: TOMLDocument, /) -> Array:
@@ -179,32 +169,59 @@ def _get_cli(doc: TOMLDocument, /) -> Array:
     return get_set_array(opt_dependencies, "cli")
 
 
+def _find_lock(path: PathLike = PYPROJECT_TOML, /) -> Path | None:
+    parent = Path(path).resolve().parent
+    if (lock := parent / "uv.lock").is_file():
+        return lock
+    for root in parent.parents:
+        try:
+            doc = read_toml_dict(root / PYPROJECT_TOML)
+        except (OSError, TOMLDecodeError):
+            continue
+        if "workspace" in doc.get("tool", {}).get("uv", {}):
+            lock = root / "uv.lock"
+            return lock if lock.is_file() else None
+    return None
+
+
+def _get_locked_versions(lock: PathLike, /) -> dict[str, Version2Or3 | None]:
+    out: dict[str, Version2Or3 | None] = {}
+    for package in read_toml_dict(lock).get("package", []):
+        with suppress(KeyError, ParseVersion2Or3Error):
+            name = canonicalize_name(package["name"])
+            version = parse_version_2_or_3(package["version"])
+            out[name] = version if out.get(name, version) == version else None
+    return out
+
+
+def _is_cli_consistent(path: PathLike = PYPROJECT_TOML, /) -> bool:
+    if (lock := _find_lock(path)) is None:
+        return False
+    try:
+        project = get_dict(read_toml_dict(path), "project")
+        versions = _get_locked_versions(lock)
+    except (OSError, TOMLDecodeError, KeyError, TypeError):
+        return False
+    dependencies = project.get("dependencies", [])
+    cli = project.get("optional-dependencies", {}).get("cli")
+    if cli is None:
+        return False
+    pinned = _get_pinned(dependencies, versions=versions)
+    return sorted(cli) == sorted(str(p) for p in pinned)
+
+
 def _get_pinned(
-    dependencies: Array,
-    /,
-    *,
-    versions: VersionSet | None = None,
-    index: MaybeSequenceStr | None = None,
-    index_username: str | None = None,
-    index_password: SecretLike | None = None,
-    native_tls: bool = False,
+    dependencies: Iterable[str], /, *, versions: Mapping[str, Version2Or3 | None]
 ) -> Array:
-    if versions is None:
-        versions_use = get_version_set(
-            index=index,
-            index_username=index_username,
-            index_password=index_password,
-            native_tls=native_tls,
-        )
-    else:
-        versions_use = versions
     result = array()
     for dep in dependencies:
         req = Requirement(dep)
         try:
-            version = versions_use[req.name]
+            version = versions[canonicalize_name(req.name)]
         except KeyError:
-            pass
+            continue
+        if version is None:
+            result.append(string(str(req)))
         else:
             pinned = (
                 req.replace(">=", None).replace("<", None).replace("==", str(version))
@@ -215,21 +232,106 @@ def _get_pinned(
 
 def _lock_and_sync(
     *,
+    path: PathLike = PYPROJECT_TOML,
     index: MaybeSequenceStr | None = None,
     index_username: str | None = None,
     index_password: SecretLike | None = None,
     native_tls: bool = False,
+    pin: bool = False,
+    force: bool = False,
+    ttl: Duration = HOUR,
+    root: PathLike = PATH_CACHE / "uv-lock",
 ) -> None:
+    key = partial(
+        _get_freshness_key,
+        path,
+        index=index,
+        index_username=index_username,
+        native_tls=native_tls,
+    )
+    if (
+        (not force)
+        and ((not pin) or _is_cli_consistent(path))
+        and _is_fresh(path, key=key(), ttl=ttl, root=root)
+    ):
+        return
+    if pin:
+        with yield_toml_doc(path) as doc:
+            _get_cli(doc).clear()
     credentials = uv_index_credentials(username=index_username, password=index_password)
     uv_lock(index=index, credentials=credentials, upgrade=True, native_tls=native_tls)
+    if pin and ((lock := _find_lock(path)) is not None):
+        _pin_dependencies(path, lock=lock)
     uv_sync(
         index=index,
         credentials=credentials,
         all_extras=True,
         all_groups=True,
-        upgrade=True,
+        upgrade=not pin,
         native_tls=native_tls,
     )
+    if (key_use := key()) is not None:
+        write_text(_path_freshness(path, root=root), key_use, overwrite=True)
+
+
+##
+
+
+def _get_freshness_key(
+    path: PathLike = PYPROJECT_TOML,
+    /,
+    *,
+    index: MaybeSequenceStr | None = None,
+    index_username: str | None = None,
+    native_tls: bool = False,
+) -> str | None:
+    if (lock_path := _find_lock(path)) is None:
+        return None
+    try:
+        doc = read_toml_dict(path)
+        lock = lock_path.read_bytes()
+    except (OSError, TOMLDecodeError):
+        return None
+    project = doc.get("project", {})
+    key = {
+        "dependencies": project.get("dependencies"),
+        "dependency-groups": doc.get("dependency-groups"),
+        "index": None if index is None else sorted(always_iterable(index)),
+        "index_username": index_username,
+        "lock": blake2b(lock, digest_size=16).hexdigest(),
+        "native_tls": native_tls,
+        "optional-dependencies": project.get("optional-dependencies"),
+        "requires-python": project.get("requires-python"),
+        "uv": doc.get("tool", {}).get("uv"),
+    }
+    data = json.dumps(key, sort_keys=True, default=str).encode()
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def _is_fresh(
+    path: PathLike = PYPROJECT_TOML,
+    /,
+    *,
+    key: str | None,
+    ttl: Duration = HOUR,
+    root: PathLike = PATH_CACHE / "uv-lock",
+) -> bool:
+    if (key is None) or not (Path(path).parent / ".venv").is_dir():
+        return False
+    entry = _path_freshness(path, root=root)
+    try:
+        age = time() - entry.stat().st_mtime
+        text = read_text(entry).strip()
+    except (FileNotFoundError, ReadTextError):
+        return False
+    return (age <= duration_to_seconds(ttl)) and (text == key)
+
+
+def _path_freshness(
+    path: PathLike = PYPROJECT_TOML, /, *, root: PathLike = PATH_CACHE / "uv-lock"
+) -> Path:
+    digest = blake2b(str(Path(path).resolve()).encode(), digest_size=16).hexdigest()
+    return Path(root, digest)
 
 
 if __name__ == "__main__":
@@ -19,13 +19,13 @@ from pre_commit_hooks.utilities import (
     get_table,
     merge_paths,
     run_all_maybe_raise,
-    yield_toml_doc,
-    yield_tool,
+    update_toml_doc,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable, MutableSet
 
+    from tomlkit import TOMLDocument
     from utilities.types import PathLike
 
 
@@ -39,21 +39,25 @@ def _main(*, paths: tuple[Path, ...], package_name: str | None = None) -> None:
     funcs: list[Callable[[], bool]] = [
         partial(_run, path=p, package_name=package_name) for p in paths_use
     ]
-    run_all_maybe_raise(*funcs)
+    run_all_maybe_raise(*funcs, documents=True)
 
 
 def _run(*, path: PathLike = BUMPVERSION_TOML, package_name: str | None = None) -> bool:
     path = Path(path)
     modifications: set[Path] = set()
-    with yield_tool(path, modifications=modifications) as table:
-        bumpversion = get_set_table(table, "bumpversion")
-        bumpversion["allow_dirty"] = True
-        bumpversion.setdefault("current_version", str(Version3(0, 1, 0)))
+    update_toml_doc(path, _update, modifications=modifications)
     if package_name is not None:
         _add_python(package_name, path=path, modifications=modifications)
     return len(modifications) == 0
 
 
+def _update(doc: TOMLDocument, /) -> None:
+    tool = get_set_table(doc, "tool")
+    bumpversion = get_set_table(tool, "bumpversion")
+    bumpversion["allow_dirty"] = True
+    bumpversion.setdefault("current_version", str(Version3(0, 1, 0)))
+
+
 def _add_python(
     package_name: str,
     /,
@@ -84,15 +88,24 @@ def _add_file(
     path_bumpversion: PathLike = BUMPVERSION_TOML,
     modifications: MutableSet[Path] | None = None,
 ) -> None:
-    with yield_toml_doc(path_bumpversion, modifications=modifications) as doc:
-        tool = get_table(doc, "tool")
-        bumpversion = get_table(tool, "bumpversion")
-        files = get_set_aot(bumpversion, "files")
-        tab = table()
-        tab["filename"] = str(path_data)
-        tab["search"] = substitute(template, version="{current_version}")
-        tab["replace"] = substitute(template, version="{new_version}")
-        ensure_contains(files, tab)
+    update_toml_doc(
+        path_bumpversion,
+        partial(_update_files, path_data=path_data, template=template),
+        modifications=modifications,
+    )
+
+
+def _update_files(
+    doc: TOMLDocument, /, *, path_data: PathLike, template: PathLike
+) -> None:
+    tool = get_table(doc, "tool")
+    bumpversion = get_table(tool, "bumpversion")
+    files = get_set_aot(bumpversion, "files")
+    tab = table()
+    tab["filename"] = str(path_data)
+    tab["search"] = substitute(template, version="{current_version}")
+    tab["replace"] = substitute(template, version="{new_version}")
+    ensure_contains(files, tab)
 
 
 if __name__ == "__main__":
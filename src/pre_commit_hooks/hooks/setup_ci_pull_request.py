@@ -113,7 +113,7 @@ def _main(
         )
         for p in paths_use
     ]
-    run_all_maybe_raise(*funcs)
+    run_all_maybe_raise(*funcs, documents=True)
 
 
 def _run(
@@ -17,13 +17,14 @@ from pre_commit_hooks.utilities import (
     get_set_table,
     merge_paths,
     run_all_maybe_raise,
-    yield_toml_doc,
+    update_toml_doc,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
 
+    from tomlkit import TOMLDocument
     from utilities.types import PathLike
 
 
@@ -39,20 +40,23 @@ def _main(*, paths: tuple[Path, ...]) -> None:
 
 def _run(*, path: PathLike = COVERAGERC_TOML) -> bool:
     modifications: set[Path] = set()
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        html = get_set_table(doc, "html")
-        html["directory"] = ".coverage/html"
-        report = get_set_table(doc, "report")
-        exclude_also = get_set_array(report, "exclude_also")
-        ensure_contains(exclude_also, "@overload", "if TYPE_CHECKING:")
-        report["skip_covered"] = True
-        report["skip_empty"] = True
-        run = get_set_table(doc, "run")
-        run["branch"] = True
-        run["data_file"] = ".coverage/data"
-        run["parallel"] = True
+    update_toml_doc(path, _update, modifications=modifications)
     return len(modifications) == 0
 
 
+def _update(doc: TOMLDocument, /) -> None:
+    html = get_set_table(doc, "html")
+    html["directory"] = ".coverage/html"
+    report = get_set_table(doc, "report")
+    exclude_also = get_set_array(report, "exclude_also")
+    ensure_contains(exclude_also, "@overload", "if TYPE_CHECKING:")
+    report["skip_covered"] = True
+    report["skip_empty"] = True
+    run = get_set_table(doc, "run")
+    run["branch"] = True
+    run["data_file"] = ".coverage/data"
+    run["parallel"] = True
+
+
 if __name__ == "__main__":
     _main()
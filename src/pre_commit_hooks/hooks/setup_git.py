@@ -2,40 +2,48 @@ from __future__ import annotations
 
 from functools import partial
 from pathlib import Path
-from re import MULTILINE, escape, search
 from typing import TYPE_CHECKING
 
 from click import command
 from utilities.click import CONTEXT_SETTINGS
-from utilities.core import is_pytest, read_text
-from utilities.importlib import files
+from utilities.core import is_pytest
 
-from pre_commit_hooks.click import paths_argument, python_flag
+from pre_commit_hooks.click import parallel_flag, paths_argument, python_flag
 from pre_commit_hooks.constants import BUMPVERSION_TOML, GITATTRIBUTES, GITIGNORE
+from pre_commit_hooks.templates import get_template
 from pre_commit_hooks.utilities import merge_paths, run_all_maybe_raise, yield_text_file
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
     from pathlib import Path
 
     from utilities.types import PathLike
 
+    from pre_commit_hooks.types import FuncAndPaths
+
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
 @python_flag
-def _main(*, paths: tuple[Path, ...], python: bool) -> None:
+@parallel_flag
+def _main(*, paths: tuple[Path, ...], python: bool, parallel: bool) -> None:
     if is_pytest():
         return
-    funcs: list[Callable[[], bool]] = []
+    funcs: list[FuncAndPaths] = []
     paths_use1 = merge_paths(*paths, target=GITATTRIBUTES, also_ok=GITIGNORE)
     funcs.extend([
-        partial(_run_gitattributes, path=p, bumpversion=p.parent / BUMPVERSION_TOML)
+        (
+            partial(
+                _run_gitattributes, path=p, bumpversion=p.parent / BUMPVERSION_TOML
+            ),
+            [p],
+        )
         for p in paths_use1
     ])
     paths_use2 = merge_paths(*paths, target=GITIGNORE, also_ok=GITATTRIBUTES)
-    funcs.extend([partial(_run_gitignore, path=p, python=python) for p in paths_use2])
-    run_all_maybe_raise(*funcs)
+    funcs.extend([
+        (partial(_run_gitignore, path=p, python=python), [p]) for p in paths_use2
+    ])
+    run_all_maybe_raise(*funcs, parallel=parallel)
 
 
 def _run_gitattributes(
@@ -43,8 +51,8 @@ def _run_gitattributes(
 ) -> bool:
     modifications: set[Path] = set()
     with yield_text_file(path, modifications=modifications) as context:
-        text = f"{bumpversion} linguist-generated=true"
-        if search(escape(text), context.output, flags=MULTILINE) is None:
+        text = get_template("gitattributes", bumpversion=bumpversion)
+        if text not in context.output:
             context.output += f"\n{text}"
     return len(modifications) == 0
 
@@ -52,19 +60,11 @@ def _run_gitattributes(
 def _run_gitignore(*, path: PathLike = GITIGNORE, python: bool = False) -> bool:
     modifications: set[Path] = set()
     with yield_text_file(path, modifications=modifications) as context:
-        text = _get_text(python=python)
-        if search(escape(text), context.output, flags=MULTILINE) is None:
+        text = get_template("gitignore", python=python)
+        if text not in context.output:
             context.output += f"\n{text}"
     return len(modifications) == 0
 
 
-def _get_text(*, python: bool = False) -> str:
-    configs = files(anchor="pre_commit_hooks") / "configs"
-    lines: list[str] = [read_text(configs / "gitignore-generic")]
-    if python:
-        lines.append(read_text(configs / "gitignore-python"))
-    return "\n\n".join(lines)
-
-
 if __name__ == "__main__":
     _main()
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from functools import partial
-from re import MULTILINE, escape, search
 from typing import TYPE_CHECKING
 
 from click import command
 from utilities.click import CONTEXT_SETTINGS
-from utilities.core import is_pytest, normalize_multi_line_str
+from utilities.core import is_pytest
 
 from pre_commit_hooks.click import paths_argument
 from pre_commit_hooks.constants import PYRIGHTCONFIG_JSON
+from pre_commit_hooks.templates import get_template
 from pre_commit_hooks.utilities import run_all_maybe_raise, yield_text_file
 
 if TYPE_CHECKING:
@@ -31,12 +31,8 @@ def _main(*, paths: tuple[Path, ...]) -> None:
 def _run(*, path: PathLike = PYRIGHTCONFIG_JSON) -> bool:
     modifications: set[Path] = set()
     with yield_text_file(path, modifications=modifications) as context:
-        text = normalize_multi_line_str("""
-            set dotenv-load := true
-            set fallback := true
-            set positional-arguments := true
-        """)
-        if search(escape(text), context.output, flags=MULTILINE) is None:
+        text = get_template("justfile")
+        if text not in context.output:
             context.output += f"\n\n{text}"
     return len(modifications) == 0
 
@@ -24,7 +24,7 @@ from pre_commit_hooks.utilities import (
     get_table,
     merge_paths,
     run_all_maybe_raise,
-    yield_toml_doc,
+    update_toml_doc,
     yield_tool_uv,
     yield_tool_uv_index,
 )
@@ -32,6 +32,7 @@ from pre_commit_hooks.utilities import (
 if TYPE_CHECKING:
     from collections.abc import Callable, MutableSet
 
+    from tomlkit import TOMLDocument
     from utilities.types import PathLike
 
 
@@ -69,7 +70,7 @@ def _main(
         )
         for p in paths_use
     ]
-    run_all_maybe_raise(*funcs)
+    run_all_maybe_raise(*funcs, documents=True)
 
 
 def _run(
@@ -84,19 +85,9 @@ def _run(
 ) -> bool:
     path = Path(path)
     modifications: set[Path] = set()
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        build_system = get_set_table(doc, "build-system")
-        build_system["build-backend"] = "uv_build"
-        build_system["requires"] = ["uv_build"]
-        project = get_set_table(doc, "project")
-        project["readme"] = str(path.parent / README_MD)
-        version_use = PYTHON_VERSION if version is None else version
-        project["requires-python"] = f">= {version_use}"
-        project.setdefault("version", "0.1.0")
-        dependency_groups = get_set_table(doc, "dependency-groups")
-        dev = get_set_array(dependency_groups, "dev")
-        _ = ensure_contains_partial_str(dev, "dycw-utilities[test]")
-        _ = ensure_contains_partial_str(dev, "pyright")
+    update_toml_doc(
+        path, partial(_update, path=path, version=version), modifications=modifications
+    )
     if description is not None:
         _add_description(description, path=path, modifications=modifications)
     if (index_name is not None) and (index_url is not None):
@@ -108,6 +99,24 @@ def _run(
     return len(modifications) == 0
 
 
+def _update(
+    doc: TOMLDocument, /, *, path: PathLike = PYPROJECT_TOML, version: str | None = None
+) -> None:
+    path = Path(path)
+    build_system = get_set_table(doc, "build-system")
+    build_system["build-backend"] = "uv_build"
+    build_system["requires"] = ["uv_build"]
+    project = get_set_table(doc, "project")
+    project["readme"] = str(path.parent / README_MD)
+    version_use = PYTHON_VERSION if version is None else version
+    project["requires-python"] = f">= {version_use}"
+    project.setdefault("version", "0.1.0")
+    dependency_groups = get_set_table(doc, "dependency-groups")
+    dev = get_set_array(dependency_groups, "dev")
+    _ = ensure_contains_partial_str(dev, "dycw-utilities[test]")
+    _ = ensure_contains_partial_str(dev, "pyright")
+
+
 def _add_description(
     description: str,
     /,
@@ -115,9 +124,11 @@ def _add_description(
     path: PathLike = PYPROJECT_TOML,
     modifications: MutableSet[Path] | None = None,
 ) -> None:
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        project = get_table(doc, "project")
-        project["description"] = description
+    update_toml_doc(
+        path,
+        partial(_set_project_key, key="description", value=description),
+        modifications=modifications,
+    )
 
 
 def _add_external_name(
@@ -127,9 +138,16 @@ def _add_external_name(
     path: PathLike = PYPROJECT_TOML,
     modifications: MutableSet[Path] | None = None,
 ) -> None:
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        project = get_table(doc, "project")
-        project["name"] = kebab_case(name)
+    update_toml_doc(
+        path,
+        partial(_set_project_key, key="name", value=kebab_case(name)),
+        modifications=modifications,
+    )
+
+
+def _set_project_key(doc: TOMLDocument, /, *, key: str, value: str) -> None:
+    project = get_table(doc, "project")
+    project[key] = value
 
 
 def _add_internal_name(
@@ -7,13 +7,14 @@ from click import command
 from utilities.click import CONTEXT_SETTINGS
 from utilities.core import is_pytest
 
-from pre_commit_hooks.click import paths_argument, version_option
+from pre_commit_hooks.click import cache_flag, paths_argument, version_option
 from pre_commit_hooks.constants import PYRIGHTCONFIG_JSON, PYTHON_VERSION
 from pre_commit_hooks.utilities import (
     ensure_contains,
     get_set_list_strs,
     merge_paths,
     run_all_maybe_raise,
+    run_cached,
     yield_json_dict,
 )
 
@@ -27,12 +28,21 @@ if TYPE_CHECKING:
 @command(**CONTEXT_SETTINGS)
 @paths_argument
 @version_option
-def _main(*, paths: tuple[Path, ...], version: str | None) -> None:
+@cache_flag
+def _main(*, paths: tuple[Path, ...], version: str | None, cache: bool) -> None:
     if is_pytest():
         return
     paths_use = merge_paths(*paths, target=PYRIGHTCONFIG_JSON)
     funcs: list[Callable[[], bool]] = [
-        partial(_run, path=p, version=version) for p in paths_use
+        partial(
+            run_cached,
+            partial(_run, path=p, version=version),
+            name="setup-pyright",
+            path=p,
+            options={"version": version},
+            cache=cache,
+        )
+        for p in paths_use
     ]
     run_all_maybe_raise(*funcs)
 
@@ -17,12 +17,13 @@ from pre_commit_hooks.utilities import (
     get_set_table,
     merge_paths,
     run_all_maybe_raise,
-    yield_toml_doc,
+    update_toml_doc,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable, MutableSet
 
+    from tomlkit import TOMLDocument
     from utilities.types import PathLike
 
 
@@ -41,57 +42,64 @@ def _main(*, paths: tuple[Path, ...], package_name: str | None) -> None:
 
 def _run(*, path: PathLike = PYTEST_TOML, package_name: str | None = None) -> bool:
     modifications: set[Path] = set()
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        pytest = get_set_table(doc, "pytest")
-        addopts = get_set_array(pytest, "addopts")
-        ensure_contains(
-            addopts,
-            "-ra",
-            "-vv",
-            "--color=auto",
-            "--durations=10",
-            "--durations-min=10",
-        )
-        pytest["asyncio_default_fixture_loop_scope"] = "function"
-        pytest["asyncio_mode"] = "auto"
-        pytest["collect_imported_tests"] = False
-        pytest["empty_parameter_set_mark"] = "fail_at_collect"
-        filterwarnings = get_set_array(pytest, "filterwarnings")
-        ensure_contains(
-            filterwarnings,
-            "error",
-            "ignore::DeprecationWarning",
-            "ignore::ResourceWarning",
-            "ignore::RuntimeWarning",
-        )
-        pytest["minversion"] = "9.0"
-        pytest["strict"] = True
-        testpaths = get_set_array(pytest, "testpaths")
-        ensure_contains(testpaths, "src/tests")
-        pytest["timeout"] = "600"
-        pytest["xfail_strict"] = True
+    update_toml_doc(path, _update, modifications=modifications)
     if package_name is not None:
         _add_coverage_opts(package_name, path=path, modifications=modifications)
     return len(modifications) == 0
 
 
+def _update(doc: TOMLDocument, /) -> None:
+    pytest = get_set_table(doc, "pytest")
+    addopts = get_set_array(pytest, "addopts")
+    ensure_contains(
+        addopts, "-ra", "-vv", "--color=auto", "--durations=10", "--durations-min=10"
+    )
+    pytest["asyncio_default_fixture_loop_scope"] = "function"
+    pytest["asyncio_mode"] = "auto"
+    pytest["collect_imported_tests"] = False
+    pytest["empty_parameter_set_mark"] = "fail_at_collect"
+    filterwarnings = get_set_array(pytest, "filterwarnings")
+    ensure_contains(
+        filterwarnings,
+        "error",
+        "ignore::DeprecationWarning",
+        "ignore::ResourceWarning",
+        "ignore::RuntimeWarning",
+    )
+    pytest["minversion"] = "9.0"
+    pytest["strict"] = True
+    testpaths = get_set_array(pytest, "testpaths")
+    ensure_contains(testpaths, "src/tests")
+    pytest["timeout"] = "600"
+    pytest["xfail_strict"] = True
+
+
 def _add_coverage_opts(
     package_name: str,
     /,
     *,
     path: PathLike = PYTEST_TOML,
     modifications: MutableSet[Path] | None = None,
+) -> None:
+    update_toml_doc(
+        path,
+        partial(_update_coverage_opts, package_name=package_name, path=path),
+        modifications=modifications,
+    )
+
+
+def _update_coverage_opts(
+    doc: TOMLDocument, /, *, package_name: str, path: PathLike = PYTEST_TOML
 ) -> None:
     path = Path(path)
-    with yield_toml_doc(path, modifications=modifications) as doc:
-        pytest = get_set_table(doc, "pytest")
-        addopts = get_set_array(pytest, "addopts")
-        ensure_contains(
-            addopts,
-            f"--cov={snake_case(package_name)}",
-            f"--cov-config={path.parent / COVERAGERC_TOML}",
-            "--cov-report=html",
-        )
+    pytest = get_set_table(doc, "pytest")
+    addopts = get_set_array(pytest, "addopts")
+    ensure_contains(
+        addopts,
+        f"--cov={snake_case(package_name)}",
+        f"--cov-config={path.parent / COVERAGERC_TOML}",
+        "--cov-report=html",
+    )
 
 
 if __name__ == "__main__":
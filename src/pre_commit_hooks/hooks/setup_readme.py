@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from functools import partial
-from re import MULTILINE, escape, search
 from typing import TYPE_CHECKING
 
 from click import command
@@ -10,6 +9,7 @@ from utilities.core import is_pytest
 
 from pre_commit_hooks.click import description_option, paths_argument, repo_name_option
 from pre_commit_hooks.constants import README_MD
+from pre_commit_hooks.templates import get_template
 from pre_commit_hooks.utilities import merge_paths, run_all_maybe_raise, yield_text_file
 
 if TYPE_CHECKING:
@@ -55,9 +55,10 @@ def _add_header(
     modifications: MutableSet[Path] | None = None,
 ) -> None:
     with yield_text_file(path, modifications=modifications) as context:
-        lines = [f"# `{repo_name}`", description]
-        text = "\n\n".join(lines)
-        if search(escape(text), context.output, flags=MULTILINE) is None:
+        text = get_template(
+            "readme-header", repo_name=repo_name, description=description
+        )
+        if text not in context.output:
             context.output += f"\n\n{text}"
 
 
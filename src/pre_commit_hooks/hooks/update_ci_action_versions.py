@@ -1,47 +1,180 @@
 from __future__ import annotations
 
-from functools import partial
-from re import MULTILINE, sub
+import json
+import re
+from functools import cache, partial
+from pathlib import Path
+from re import MULTILINE, Match, Pattern, escape
+from time import time
 from typing import TYPE_CHECKING
 
 from click import command
 from utilities.click import CONTEXT_SETTINGS
-from utilities.core import is_pytest
+from utilities.constants import HOUR
+from utilities.core import duration_to_seconds, is_pytest, write_text
+from utilities.subprocess import RunError, run
 
-from pre_commit_hooks.click import paths_argument
-from pre_commit_hooks.utilities import run_all_maybe_raise, yield_text_file
+from pre_commit_hooks.click import (
+    action_mirrors_option,
+    action_snapshot_option,
+    action_versions_option,
+    action_versions_ttl_option,
+    paths_argument,
+)
+from pre_commit_hooks.constants import PATH_CACHE, PYPROJECT_TOML
+from pre_commit_hooks.utilities import (
+    read_toml_dict,
+    run_all_maybe_raise,
+    yield_text_file,
+)
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterable, Mapping
 
-    from utilities.types import PathLike
+    from utilities.types import Duration, PathLike
+    from whenever import TimeDelta
+
+
+_DEFAULT_VERSIONS = {
+    "actions/checkout": "v6",
+    "actions/setup-python": "v6",
+    "astral-sh/ruff-action": "v3",
+    "astral-sh/setup-uv": "v7",
+}
+_PATH_CACHE = PATH_CACHE / "action-versions.json"
 
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
-def _main(*, paths: tuple[Path, ...]) -> None:
+@action_versions_option
+@action_mirrors_option
+@action_snapshot_option
+@action_versions_ttl_option
+def _main(
+    *,
+    paths: tuple[Path, ...],
+    action_versions: list[str] | None,
+    action_mirrors: Path | None,
+    action_snapshot: Path | None,
+    action_versions_ttl: TimeDelta,
+) -> None:
     if is_pytest():
         return
-    run_all_maybe_raise(*(partial(_run, p) for p in paths))
+    resolved = _resolve_versions(
+        mirrors=action_mirrors,
+        snapshot=action_snapshot,
+        ttl=action_versions_ttl,
+        actions=_get_versions(action_versions=action_versions),
+    )
+    versions = _get_versions(action_versions=action_versions, resolved=resolved)
+    run_all_maybe_raise(*(partial(_run, p, versions=versions) for p in paths))
 
 
-def _run(path: PathLike, /) -> bool:
+def _run(path: PathLike, /, *, versions: Mapping[str, str] | None = None) -> bool:
     modifications: set[Path] = set()
-    versions = {
-        "actions/checkout": "v6",
-        "actions/setup-python": "v6",
-        "astral-sh/ruff-action": "v3",
-        "astral-sh/setup-uv": "v7",
-    }
+    versions_use = _DEFAULT_VERSIONS if versions is None else versions
+    pattern = _get_pattern(tuple(sorted(versions_use)))
+
+    def repl(match: Match[str], /) -> str:
+        return f"{match['prefix']}@{versions_use[match['action']]}"
+
     with yield_text_file(path, modifications=modifications) as context:
-        text = context.input
-        for action, version in versions.items():
-            text = sub(
-                rf"^(\s*- uses: {action})@.+$", rf"\1@{version}", text, flags=MULTILINE
-            )
-        context.output = text
+        context.output = pattern.sub(repl, context.input)
     return len(modifications) == 0
 
 
+def _get_versions(
+    *,
+    action_versions: list[str] | None = None,
+    path: PathLike = PYPROJECT_TOML,
+    resolved: Mapping[str, str] | None = None,
+) -> dict[str, str]:
+    out = dict(_DEFAULT_VERSIONS)
+    if resolved is not None:
+        out.update(resolved)
+    try:
+        doc = read_toml_dict(path)
+    except FileNotFoundError:
+        pass
+    else:
+        tool = doc.get("tool", {}).get("pre-commit-hooks", {})
+        out.update(tool.get("action-versions", {}))
+    for item in [] if action_versions is None else action_versions:
+        action, sep, version = item.rpartition("@")
+        if (sep == "") or (action == "") or (version == ""):
+            msg = f"Invalid action version; got {item!r}"
+            raise ValueError(msg)
+        out[action] = version
+    return out
+
+
+def _resolve_versions(
+    *,
+    cache: PathLike = _PATH_CACHE,
+    mirrors: PathLike | None = None,
+    snapshot: PathLike | None = None,
+    ttl: Duration = 24 * HOUR,
+    actions: Iterable[str] = _DEFAULT_VERSIONS,
+) -> dict[str, str]:
+    cache = Path(cache)
+    try:
+        age = time() - cache.stat().st_mtime
+    except FileNotFoundError:
+        age = None
+    if (age is not None) and (age <= duration_to_seconds(ttl)):
+        return _read_cache(cache)
+    if (mirrors is None) and (snapshot is None):
+        return {} if age is None else _read_cache(cache)
+    out: dict[str, str] = {}
+    if snapshot is not None:
+        out.update(json.loads(Path(snapshot).read_text()))
+    if mirrors is not None:
+        out.update(_read_mirrors(mirrors, actions))
+    write_text(cache, json.dumps(out, sort_keys=True), overwrite=True)
+    return out
+
+
+def _read_cache(path: Path, /) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _read_mirrors(root: PathLike, actions: Iterable[str], /) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for action in actions:
+        for path in [Path(root, f"{action}.git"), Path(root, action)]:
+            if path.is_dir():
+                if (major := _get_latest_major(path)) is not None:
+                    out[action] = f"v{major}"
+                break
+    return out
+
+
+def _get_latest_major(path: Path, /) -> int | None:
+    try:
+        text = run("git", "-C", str(path), "tag", "--list", return_=True)
+    except RunError:
+        return None
+    majors = [
+        int(match["major"])
+        for line in text.splitlines()
+        if (match := _TAG_PATTERN.match(line.strip())) is not None
+    ]
+    return max(majors, default=None)
+
+
+_TAG_PATTERN = re.compile(r"^v(?P<major>\d+)(\.\d+)*$")
+
+
+@cache
+def _get_pattern(actions: tuple[str, ...], /) -> Pattern[str]:
+    alternation = "|".join(map(escape, actions))
+    return re.compile(
+        rf"^(?P<prefix>\s*- uses: (?P<action>{alternation}))@.+$", MULTILINE
+    )
+
+
 if __name__ == "__main__":
     _main()
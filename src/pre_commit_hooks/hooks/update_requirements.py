@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
+from functools import cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +15,8 @@ from pre_commit_hooks.click import (
     index_username_option,
     native_tls_flag,
     paths_argument,
+    refresh_flag,
+    version_set_ttl_option,
 )
 from pre_commit_hooks.constants import PYPROJECT_TOML
 from pre_commit_hooks.utilities import (
@@ -30,6 +32,7 @@ if TYPE_CHECKING:
 
     from utilities.packaging import Requirement
     from utilities.types import MaybeSequenceStr, PathLike, SecretLike
+    from whenever import TimeDelta
 
     from pre_commit_hooks.types import VersionSet
 
@@ -43,6 +46,8 @@ type _Version1or2 = int | Version2
 @index_username_option
 @index_password_option
 @native_tls_flag
+@refresh_flag
+@version_set_ttl_option
 def _main(
     *,
     paths: tuple[Path, ...],
@@ -50,14 +55,21 @@ def _main(
     index_username: str | None,
     index_password: SecretLike | None,
     native_tls: bool,
+    refresh: bool,
+    version_set_ttl: TimeDelta,
 ) -> None:
     if is_pytest():
         return
-    versions = get_version_set(
-        index=index,
-        index_username=index_username,
-        index_password=index_password,
-        native_tls=native_tls,
+    versions = cache(
+        partial(
+            get_version_set,
+            index=index,
+            index_username=index_username,
+            index_password=index_password,
+            native_tls=native_tls,
+            refresh=refresh,
+            ttl=version_set_ttl,
+        )
     )
     funcs: list[Callable[[], bool]] = [
         partial(
@@ -77,20 +89,25 @@ def _main(
 def _run(
     *,
     path: PathLike = PYPROJECT_TOML,
-    versions: VersionSet | None = None,
+    versions: Callable[[], VersionSet] | None = None,
     index: MaybeSequenceStr | None = None,
     index_username: str | None = None,
     index_password: SecretLike | None = None,
     native_tls: bool = False,
 ) -> bool:
-    func = partial(
-        _transform,
-        versions=versions,
-        index=index,
-        index_username=index_username,
-        index_password=index_password,
-        native_tls=native_tls,
-    )
+    if versions is None:
+        versions_use = cache(
+            partial(
+                get_version_set,
+                index=index,
+                index_username=index_username,
+                index_password=index_password,
+                native_tls=native_tls,
+            )
+        )
+    else:
+        versions_use = versions
+    func = partial(_transform, versions=versions_use)
     modifications: set[Path] = set()
     with yield_toml_doc(path, modifications=modifications) as doc:
         get_pyproject_dependencies(doc).map_requirements(func)
@@ -98,26 +115,10 @@ def _run(
 
 
 def _transform(
-    requirement: Requirement,
-    /,
-    *,
-    versions: VersionSet | None = None,
-    index: MaybeSequenceStr | None = None,
-    index_username: str | None = None,
-    index_password: SecretLike | None = None,
-    native_tls: bool = False,
+    requirement: Requirement, /, *, versions: Callable[[], VersionSet]
 ) -> Requirement:
-    if versions is None:
-        versions_use = get_version_set(
-            index=index,
-            index_username=index_username,
-            index_password=index_password,
-            native_tls=native_tls,
-        )
-    else:
-        versions_use = versions
     try:
-        lower = parse_version_2_or_3(requirement[">="])
+        lower = _parse_version_2_or_3(requirement[">="])
     except KeyError:
         lower = None
     try:
@@ -125,10 +126,10 @@ def _transform(
     except KeyError:
         upper = None
     try:
-        fixed = parse_version_2_or_3(requirement["=="])
+        fixed = _parse_version_2_or_3(requirement["=="])
     except KeyError:
         fixed = None
-    latest = versions_use.get(requirement.name)
+    latest = versions().get(requirement.name)
     new_lower: Version2Or3 | None = None
     new_upper: _Version1or2 | None = None
     match lower, upper, fixed, latest:
@@ -182,6 +183,7 @@ def _transform(
     return requirement
 
 
+@cache
 def _parse_version_1_or_2(version: str, /) -> _Version1or2:
     try:
         return int(version)
@@ -189,5 +191,8 @@ def _parse_version_1_or_2(version: str, /) -> _Version1or2:
         return Version2.parse(version)
 
 
+_parse_version_2_or_3 = cache(parse_version_2_or_3)
+
+
 if __name__ == "__main__":
     _main()
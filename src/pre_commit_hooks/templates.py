@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from functools import cache
+from inspect import Parameter, signature
+from typing import TYPE_CHECKING, Any
+
+from utilities.core import normalize_multi_line_str, read_text
+from utilities.importlib import files
+
+from pre_commit_hooks.constants import BUMPVERSION_TOML, PYTHON_VERSION
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from utilities.types import PathLike, SecretLike
+
+
+def get_template(name: str, /, **kwargs: Any) -> str:
+    return _TEMPLATES[name](**kwargs)
+
+
+def list_templates() -> dict[str, str]:
+    out: dict[str, str] = {}
+    for name, func in sorted(_TEMPLATES.items()):
+        kwargs = {
+            k: f"<{k}>"
+            for k, p in signature(func).parameters.items()
+            if p.default is Parameter.empty
+        }
+        out[name] = func(**kwargs)
+    return out
+
+
+##
+
+
+@cache
+def _direnv_header() -> str:
+    return normalize_multi_line_str("""
+        #!/usr/bin/env sh
+        # shellcheck source=/dev/null
+
+        # echo
+        echo_date() { echo "[$(date +'%Y-%m-%d %H:%M:%S')] $*" >&2; }
+    """)
+
+
+@cache
+def _direnv_python(
+    *,
+    index_name: str | None = None,
+    index_username: str | None = None,
+    index_password: SecretLike | None = None,
+    native_tls: bool = False,
+    version: str | None = None,
+) -> str:
+    lines: list[str] = ["# uv"]
+    if index_name is not None:
+        if index_username is not None:
+            lines.append(
+                f"export UV_INDEX_{index_name.upper()}_USERNAME='{index_username}'"
+            )
+        if index_password is not None:
+            from utilities.pydantic import extract_secret
+
+            value = extract_secret(index_password)
+            lines.append(f"export UV_INDEX_{index_name.upper()}_PASSWORD='{value}'")
+    lines.append("export UV_MANAGED_PYTHON='true'")
+    if native_tls:
+        lines.append("export UV_NATIVE_TLS='true'")
+    version_use = PYTHON_VERSION if version is None else version
+    lines.extend([
+        "export UV_PRERELEASE='disallow'",
+        f"export UV_PYTHON='{version_use}'",
+        "export UV_RESOLUTION='highest'",
+        "export UV_VENV_CLEAR='true'",
+        normalize_multi_line_str("""\
+            if ! command -v uv >/dev/null 2>&1; then
+            \techo_date "ERROR: 'uv' not found" && exit 1
+            fi
+        """).rstrip("\n"),
+        "activate='.venv/bin/activate'",
+        normalize_multi_line_str("""\
+            if [ -f $activate ]; then
+            \t. $activate
+            else
+            \tuv venv
+            fi
+        """).rstrip("\n"),
+        "uv sync --all-extras --all-groups --active --locked",
+    ])
+    return "\n".join(lines) + "\n"
+
+
+@cache
+def _gitattributes(*, bumpversion: PathLike = BUMPVERSION_TOML) -> str:
+    return f"{bumpversion} linguist-generated=true"
+
+
+@cache
+def _gitignore(*, python: bool = False) -> str:
+    configs = files(anchor="pre_commit_hooks") / "configs"
+    lines: list[str] = [read_text(configs / "gitignore-generic")]
+    if python:
+        lines.append(read_text(configs / "gitignore-python"))
+    return "\n\n".join(lines)
+
+
+@cache
+def _justfile() -> str:
+    return normalize_multi_line_str("""
+        set dotenv-load := true
+        set fallback := true
+        set positional-arguments := true
+    """)
+
+
+@cache
+def _readme_header(*, repo_name: str, description: str) -> str:
+    lines = [f"# `{repo_name}`", description]
+    return "\n\n".join(lines)
+
+
+_TEMPLATES: dict[str, Callable[..., str]] = {
+    "direnv-header": _direnv_header,
+    "direnv-python": _direnv_python,
+    "gitattributes": _gitattributes,
+    "gitignore": _gitignore,
+    "justfile": _justfile,
+    "readme-header": _readme_header,
+}
+
+
+__all__ = ["get_template", "list_templates"]
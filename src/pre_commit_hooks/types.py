@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from tomlkit.container import Container
 from tomlkit.items import AoT, Array, Table
 from utilities.packaging import Requirement
-from utilities.types import StrDict
+from utilities.types import PathLike, StrDict
 from utilities.version import Version2Or3
 
 type ArrayLike = AoT | list[str] | list[StrDict]
 type ContainerLike = Container | Table
+type FuncAndPaths = tuple[Callable[[], bool], Sequence[PathLike]]
 type FuncRequirement = Callable[[Requirement], Requirement]
 type TransformArray = Callable[[Array], None]
 type VersionSet = dict[str, Version2Or3]
@@ -18,6 +19,7 @@ type VersionSet = dict[str, Version2Or3]
 __all__ = [
     "ArrayLike",
     "ContainerLike",
+    "FuncAndPaths",
     "FuncRequirement",
     "TransformArray",
     "VersionSet",
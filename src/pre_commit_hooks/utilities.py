@@ -1,26 +1,32 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterator, MutableSet
-from contextlib import contextmanager, suppress
-from dataclasses import dataclass
-from functools import partial
+import re
+from collections.abc import Hashable, Iterator, Mapping, MutableSet
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, suppress
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import cache, partial
+from hashlib import blake2b
+from heapq import merge
+from itertools import repeat
+from math import ceil
 from operator import eq
+from os import cpu_count
 from pathlib import Path
-from subprocess import CalledProcessError
-from typing import TYPE_CHECKING, Any, overload
-
-import tomlkit
-import yaml
-from libcst import Module, parse_module
-from pydantic import SecretStr
-from tomlkit import TOMLDocument, aot, array, document, string, table
-from tomlkit.exceptions import ParseError
-from tomlkit.items import AoT, Array, Table
+from string import Formatter
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Any, Self, SupportsIndex, cast, overload, override
+
+from utilities.constants import HOUR
 from utilities.core import (
     OneEmptyError,
     ReadTextError,
     always_iterable,
+    duration_to_seconds,
+    identity,
     is_pytest,
     max_nullable,
     one,
@@ -28,13 +34,17 @@ from utilities.core import (
     write_text,
 )
 from utilities.functions import ensure_class, ensure_str
-from utilities.packaging import Requirement
-from utilities.pydantic import extract_secret
-from utilities.subprocess import RunError, run, uv_pip_list
 from utilities.types import PathLike, StrDict
 from utilities.typing import is_str_dict
-from utilities.version import Version2, Version3, Version3Error
+from utilities.version import (
+    ParseVersion2Or3Error,
+    Version2,
+    Version3,
+    Version3Error,
+    parse_version_2_or_3,
+)
 
+from pre_commit_hooks import __version__
 from pre_commit_hooks.constants import (
     BUMPVERSION_TOML,
     PATH_CACHE,
@@ -44,19 +54,25 @@ from pre_commit_hooks.constants import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, MutableSet
+    from collections.abc import Callable, Iterable, Iterator, MutableSet, Sequence
 
+    from libcst import CSTTransformer, Module
+    from tomlkit import TOMLDocument
+    from tomlkit.items import AoT, Array, Table
     from utilities.types import (
+        Duration,
         MaybeSequence,
         MaybeSequenceStr,
         PathLike,
         SecretLike,
         StrDict,
     )
+    from yaml import CSafeLoader, SafeDumper, SafeLoader
 
     from pre_commit_hooks.types import (
         ArrayLike,
         ContainerLike,
+        FuncAndPaths,
         FuncRequirement,
         TransformArray,
         VersionSet,
@@ -96,9 +112,11 @@ def ensure_contains(container: list[str], /, *objs: str) -> None: ...
 @overload
 def ensure_contains(container: list[StrDict], /, *objs: StrDict) -> None: ...
 def ensure_contains(container: ArrayLike, /, *objs: Any) -> None:
+    index = _ContainerIndex.build(container)
     for obj in objs:
-        if obj not in container:
+        if index.find(obj, is_match=_is_in) is None:
             container.append(obj)
+            index.add(len(container) - 1, container[-1])
 
 
 def ensure_contains_partial_dict(
@@ -107,8 +125,8 @@ def ensure_contains_partial_dict(
     try:
         return get_partial_dict(container, dict_)
     except OneEmptyError:
-        container.append(dict_)
-        return dict_
+        container.append(value := _track_as(container, dict_))
+        return value
 
 
 def ensure_contains_partial_str(list_: Array | list[str], text: str, /) -> str:
@@ -126,13 +144,64 @@ def ensure_not_contains(container: list[str], /, *objs: str) -> None: ...
 @overload
 def ensure_not_contains(container: list[StrDict], /, *objs: StrDict) -> None: ...
 def ensure_not_contains(container: ArrayLike, /, *objs: Any) -> None:
+    index = _ContainerIndex.build(container)
     for obj in objs:
+        if (i := index.find(obj, is_match=eq)) is not None:
+            index.removed.add(i)
+    for i in sorted(index.removed, reverse=True):
+        del container[i]
+
+
+@dataclass(kw_only=True, slots=True)
+class _ContainerIndex:
+    container: ArrayLike
+    buckets: dict[Hashable, list[int]] = field(default_factory=dict)
+    unhashable: list[int] = field(default_factory=list)
+    removed: set[int] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, container: ArrayLike, /) -> Self:
+        index = cls(container=container)
+        for i, obj in enumerate(container):
+            index.add(i, obj)
+        return index
+
+    def add(self, i: int, obj: Any, /) -> None:
         try:
-            index = next(i for i, o in enumerate(container) if o == obj)
-        except StopIteration:
-            pass
+            key = _freeze(obj)
+        except TypeError:
+            self.unhashable.append(i)
         else:
-            del container[index]
+            self.buckets.setdefault(key, []).append(i)
+
+    def find(self, obj: Any, /, *, is_match: Callable[[Any, Any], bool]) -> int | None:
+        try:
+            key = _freeze(obj)
+        except TypeError:
+            candidates: Iterable[int] = range(len(self.container))
+        else:
+            candidates = merge(self.buckets.get(key, []), self.unhashable)
+        for i in candidates:
+            if (i not in self.removed) and is_match(self.container[i], obj):
+                return i
+        return None
+
+
+def _freeze(obj: Any, /) -> Hashable:
+    match obj:
+        case Mapping():
+            return frozenset((k, _freeze(v)) for k, v in obj.items())
+        case list() | tuple():
+            return tuple(map(_freeze, obj))
+        case set() | frozenset():
+            return frozenset(map(_freeze, obj))
+        case _:
+            _ = hash(obj)
+            return obj
+
+
+def _is_in(x: Any, y: Any, /) -> bool:
+    return (x is y) or (x == y)
 
 
 ##
@@ -146,11 +215,15 @@ def ensure_new_line(text: str, /) -> str:
 
 
 def get_aot(container: ContainerLike, key: str, /) -> AoT:
-    return ensure_class(container[key], AoT)
+    from tomlkit.items import AoT
+
+    return cast("AoT", ensure_class(container[key], (AoT, TrackedList)))
 
 
 def get_array(container: ContainerLike, key: str, /) -> Array:
-    return ensure_class(container[key], Array)
+    from tomlkit.items import Array
+
+    return cast("Array", ensure_class(container[key], (Array, TrackedList)))
 
 
 def get_dict(dict_: StrDict, key: str, /) -> StrDict:
@@ -176,7 +249,9 @@ def get_list_strs(dict_: StrDict, key: str, /) -> list[str]:
 
 
 def get_table(container: ContainerLike, key: str, /) -> Table:
-    return ensure_class(container[key], Table)
+    from tomlkit.items import Table
+
+    return cast("Table", ensure_class(container[key], (Table, TrackedDict)))
 
 
 ##
@@ -190,7 +265,7 @@ def get_set_partial_dict(dicts: list[StrDict], dict_: StrDict, /) -> StrDict:
     try:
         return get_partial_dict(dicts, dict_)
     except OneEmptyError:
-        copy = dict_.copy()
+        copy = _track_as(dicts, dict_.copy())
         dicts.append(copy)
         return copy
 
@@ -198,18 +273,17 @@ def get_set_partial_dict(dicts: list[StrDict], dict_: StrDict, /) -> StrDict:
 def _is_partial_dict(obj: Any, dict_: StrDict, /) -> bool:
     if not isinstance(obj, dict):
         return False
-    results: dict[str, bool] = {}
     for key, obj_value in obj.items():
         try:
             dict_value = dict_[key]
         except KeyError:
-            results[key] = False
-        else:
-            if isinstance(obj_value, dict) and isinstance(dict_value, dict):
-                results[key] = _is_partial_dict(obj_value, dict_value)
-            else:
-                results[key] = obj_value == dict_value
-    return all(results.values())
+            return False
+        if isinstance(obj_value, dict) and isinstance(dict_value, dict):
+            if not _is_partial_dict(obj_value, dict_value):
+                return False
+        elif obj_value != dict_value:
+            return False
+    return True
 
 
 ##
@@ -271,20 +345,22 @@ class PyProjectDependencies:
                 func(deps)
 
     def map_requirements(self, func: FuncRequirement, /) -> None:
-        if (deps := self.dependencies) is not None:
-            self._map_requirements1(deps, func)
-        if (opt_depedencies := self.opt_dependencies) is not None:
-            for deps in opt_depedencies.values():
-                self._map_requirements1(deps, func)
-        if (dep_grps := self.dep_groups) is not None:
-            for deps in dep_grps.values():
-                self._map_requirements1(deps, func)
+        results: dict[str, str] = {}
+        self.map_array(partial(self._map_requirements1, func=func, results=results))
+
+    def _map_requirements1(
+        self, array: Array, /, *, func: FuncRequirement, results: dict[str, str]
+    ) -> None:
+        from tomlkit import string
+        from utilities.packaging import Requirement
 
-    def _map_requirements1(self, array: Array, func: FuncRequirement, /) -> None:
         new: list[str] = []
-        for curr_i in array:
-            req = Requirement(ensure_str(curr_i))
-            new.append(str(func(req)))
+        for curr_i in map(ensure_str, array):
+            try:
+                new_i = results[curr_i]
+            except KeyError:
+                new_i = results[curr_i] = str(func(Requirement(curr_i)))
+            new.append(new_i)
         array.clear()
         for new_i in sorted(new):
             array.append(string(new_i))
@@ -297,6 +373,8 @@ def get_set_aot(container: ContainerLike, key: str, /) -> AoT:
     try:
         return get_aot(container, key)
     except KeyError:
+        from tomlkit import aot
+
         value = container[key] = aot()
         return value
 
@@ -305,6 +383,8 @@ def get_set_array(container: ContainerLike, key: str, /) -> Array:
     try:
         return get_array(container, key)
     except KeyError:
+        from tomlkit import array
+
         value = container[key] = array()
         return value
 
@@ -313,7 +393,7 @@ def get_set_dict(dict_: StrDict, key: str, /) -> StrDict:
     try:
         return get_dict(dict_, key)
     except KeyError:
-        value = dict_[key] = {}
+        value = dict_[key] = _track_as(dict_, {})
         return value
 
 
@@ -321,7 +401,7 @@ def get_set_list_dicts(dict_: StrDict, key: str, /) -> list[StrDict]:
     try:
         return get_list_dicts(dict_, key)
     except KeyError:
-        value = dict_[key] = []
+        value = dict_[key] = _track_as(dict_, [])
         return value
 
 
@@ -329,7 +409,7 @@ def get_set_list_strs(dict_: StrDict, key: str, /) -> list[str]:
     try:
         return get_list_strs(dict_, key)
     except KeyError:
-        value = dict_[key] = []
+        value = dict_[key] = _track_as(dict_, [])
         return value
 
 
@@ -337,6 +417,8 @@ def get_set_table(container: ContainerLike, key: str, /) -> Table:
     try:
         return get_table(container, key)
     except KeyError:
+        from tomlkit import table
+
         value = container[key] = table()
         return value
 
@@ -344,32 +426,86 @@ def get_set_table(container: ContainerLike, key: str, /) -> Table:
 ##
 
 
-def get_version_from_path(*, path: PathLike = BUMPVERSION_TOML) -> Version3:
-    return _get_version_from_toml_text(read_text(path))
+def read_toml_dict(path: PathLike, /) -> StrDict:
+    import tomllib
+
+    with Path(path).open(mode="rb") as fh:
+        return tomllib.load(fh)
+
+
+##
+
+
+def get_version_from_path(
+    *,
+    path: PathLike = BUMPVERSION_TOML,
+    cache: bool = True,
+    root: PathLike = PATH_CACHE / "version-from-path",
+) -> Version3:
+    text = read_text(path)
+    if not cache:
+        return _get_version_from_toml_text(text)
+    entry = Path(root, blake2b(text.encode(), digest_size=16).hexdigest())
+    with suppress(ReadTextError, Version3Error):
+        return Version3.parse(read_text(entry).strip())
+    version = _get_version_from_toml_text(text)
+    write_text(entry, str(version), overwrite=True)
+    return version
+
+
+def get_version_origin_master(
+    *,
+    path: PathLike = BUMPVERSION_TOML,
+    cache: bool = True,
+    root: PathLike = PATH_CACHE / "origin-master",
+) -> Version3:
+    from utilities.subprocess import RunError, run
+
+    try:
+        sha = run(
+            "git", "rev-parse", "--verify", "origin/master^{commit}", return_=True
+        ).strip()
+    except RunError:
+        msg = "Unable to get the version of origin/master"
+        raise ValueError(msg) from None
+    entry = Path(
+        root, f"{sha}--{blake2b(str(path).encode(), digest_size=8).hexdigest()}"
+    )
+    if cache:
+        with suppress(ReadTextError, Version3Error):
+            return Version3.parse(read_text(entry))
+    version = _get_version_at_commit(sha, path=path)
+    if cache:
+        write_text(entry, str(version), overwrite=True)
+    return version
+
 
+def _get_version_at_commit(
+    sha: str, /, *, path: PathLike = BUMPVERSION_TOML
+) -> Version3:
+    from utilities.subprocess import RunError, run
 
-def get_version_origin_master(*, path: PathLike = BUMPVERSION_TOML) -> Version3:
-    with suppress(CalledProcessError):
-        text = run("git", "tag", "--points-at", "origin/master", return_=True)
+    with suppress(RunError):
+        text = run("git", "tag", "--points-at", sha, return_=True)
         for line in text.splitlines():
             with suppress(Version3Error):
                 return Version3.parse(line)
     try:
-        text = run("git", "show", f"origin/master:{path}", return_=True)
-    except CalledProcessError:
+        text = run("git", "show", f"{sha}:{path}", return_=True)
+    except RunError:
         msg = "Unable to get the version of origin/master"
         raise ValueError(msg) from None
     return _get_version_from_toml_text(text)
 
 
 def _get_version_from_toml_text(text: str, /) -> Version3:
+    import tomllib
+
     try:
-        doc = tomlkit.parse(text)
-        tool = get_table(doc, "tool")
-        bumpversion = get_table(tool, "bumpversion")
-        version = bumpversion["current_version"]
-        return Version3.parse(str(version))
-    except (ParseError, KeyError, Version3Error):
+        doc = tomllib.loads(text)
+        bumpversion = get_dict(get_dict(doc, "tool"), "bumpversion")
+        return Version3.parse(str(bumpversion["current_version"]))
+    except (tomllib.TOMLDecodeError, KeyError, TypeError, Version3Error):
         msg = f"Unable to get the version from {text!r}"
         raise ValueError(msg) from None
 
@@ -383,8 +519,21 @@ def get_version_set(
     index_username: str | None = None,
     index_password: SecretLike | None = None,
     native_tls: bool = False,
+    refresh: bool = False,
+    ttl: Duration = HOUR,
 ) -> VersionSet:
-    out: StrDict = {}
+    from utilities.subprocess import run, uv_pip_list, uv_pip_list_cmd
+
+    installed = run(
+        *uv_pip_list_cmd(exclude_editable=True, format_="json"), return_stdout=True
+    )
+    path = _path_version_set_cache(
+        installed, index=index, index_username=index_username
+    )
+    if not refresh:
+        with suppress(_VersionSetCacheError):
+            return _read_version_set_cache(path, ttl=ttl)
+    out: VersionSet = {}
     for item in uv_pip_list(
         exclude_editable=True,
         index=index,
@@ -400,9 +549,57 @@ def get_version_set(
                 out[item.name] = max_nullable([item.version, item.latest_version])
             case _:
                 raise TypeError(item.version, item.latest_version)
+    _write_version_set_cache(path, out)
     return out
 
 
+def _path_version_set_cache(
+    installed: str,
+    /,
+    *,
+    index: MaybeSequenceStr | None = None,
+    index_username: str | None = None,
+) -> Path:
+    key = {
+        "index": None if index is None else sorted(always_iterable(index)),
+        "index_username": index_username,
+        "installed": installed,
+    }
+    data = json.dumps(key, sort_keys=True).encode()
+    digest = blake2b(data, digest_size=16).hexdigest()
+    return PATH_CACHE / "version-set" / f"{digest}.json"
+
+
+def _read_version_set_cache(path: Path, /, *, ttl: Duration = HOUR) -> VersionSet:
+    try:
+        age = time() - path.stat().st_mtime
+    except FileNotFoundError:
+        raise _VersionSetCacheError from None
+    if age > duration_to_seconds(ttl):
+        raise _VersionSetCacheError
+    try:
+        data = json.loads(read_text(path))
+        return {
+            ensure_str(k): parse_version_2_or_3(ensure_str(v)) for k, v in data.items()
+        }
+    except (
+        ReadTextError,
+        ValueError,
+        TypeError,
+        AttributeError,
+        ParseVersion2Or3Error,
+    ):
+        raise _VersionSetCacheError from None
+
+
+def _write_version_set_cache(path: Path, versions: VersionSet, /) -> None:
+    data = {k: str(v) for k, v in versions.items()}
+    write_text(path, json.dumps(data, sort_keys=True), overwrite=True)
+
+
+class _VersionSetCacheError(Exception): ...
+
+
 ##
 
 
@@ -457,6 +654,8 @@ def re_insert_array(array: Array, /) -> None:
 
 
 def re_insert_dict(dict_: StrDict, keys: list[str], /) -> None:
+    if list(dict_) == [k for k in keys if k in dict_]:
+        return
     copy = dict_.copy()
     dict_.clear()
     for key in keys:
@@ -485,25 +684,214 @@ def re_insert_table(table: Table, /) -> None:
 ##
 
 
-def run_all(*funcs: Callable[[], bool]) -> bool:
-    results = [f() for f in funcs]
+def run_all(
+    *funcs: Callable[[], bool] | FuncAndPaths,
+    parallel: bool = False,
+    max_workers: int | None = None,
+) -> bool:
+    if not parallel:
+        results = [_get_func(f)() for f in funcs]
+        return all(results)
+    groups, unknown = _group_by_paths(*funcs)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_run_group, groups))
+    results.extend(f() for f in unknown)
     return all(results)
 
 
-def run_all_maybe_raise(*funcs: Callable[[], bool]) -> None:
-    if not run_all(*funcs):
+def run_all_maybe_raise(
+    *funcs: Callable[[], bool] | FuncAndPaths,
+    parallel: bool = False,
+    max_workers: int | None = None,
+    documents: bool = False,
+) -> None:
+    try:
+        with yield_document_cache() if documents else nullcontext():
+            result = run_all(*funcs, parallel=parallel, max_workers=max_workers)
+    finally:
+        run_formatters()
+    if not result:
         raise SystemExit(1)
 
 
+def _get_func(func: Callable[[], bool] | FuncAndPaths, /) -> Callable[[], bool]:
+    return func[0] if isinstance(func, tuple) else func
+
+
+def _group_by_paths(
+    *funcs: Callable[[], bool] | FuncAndPaths,
+) -> tuple[list[list[Callable[[], bool]]], list[Callable[[], bool]]]:
+    groups: list[tuple[set[Path], list[Callable[[], bool]]]] = []
+    unknown: list[Callable[[], bool]] = []
+    for func in funcs:
+        if not isinstance(func, tuple):
+            unknown.append(func)
+            continue
+        func_i, paths_i = func
+        paths = {Path(p).resolve() for p in paths_i}
+        if len(paths) == 0:
+            unknown.append(func_i)
+            continue
+        matches = [g for g in groups if not g[0].isdisjoint(paths)]
+        merged_paths, merged_funcs = paths, []
+        for match_paths, match_funcs in matches:
+            merged_paths |= match_paths
+            merged_funcs.extend(match_funcs)
+            groups.remove((match_paths, match_funcs))
+        merged_funcs.append(func_i)
+        groups.append((merged_paths, merged_funcs))
+    return [funcs_i for _, funcs_i in groups], unknown
+
+
+def _run_group(funcs: list[Callable[[], bool]], /) -> bool:
+    results = [f() for f in funcs]
+    return all(results)
+
+
+##
+
+
+def run_cached(
+    func: Callable[[], bool],
+    /,
+    *,
+    name: str,
+    path: PathLike,
+    options: StrDict | None = None,
+    cache: bool = True,
+    root: PathLike = PATH_CACHE / "results",
+    max_entries: int = 1024,
+) -> bool:
+    if not cache:
+        return func()
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return func()
+    key = json.dumps(
+        {"name": name, "options": options, "version": __version__},
+        sort_keys=True,
+        default=str,
+    ).encode()
+    digest = blake2b(key + b"\0" + data, digest_size=16).hexdigest()
+    entry = Path(root, digest)
+    if entry.is_file():
+        entry.touch()
+        return True
+    result = func()
+    if result:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        entry.touch()
+        _evict_result_cache(entry.parent, max_entries=max_entries)
+    return result
+
+
+def _evict_result_cache(root: Path, /, *, max_entries: int = 1024) -> None:
+    entries = list(root.iterdir())
+    if len(entries) <= max_entries:
+        return
+    with suppress(FileNotFoundError):
+        entries.sort(key=lambda p: p.stat().st_mtime_ns)
+        for entry in entries[: len(entries) - max_entries]:
+            entry.unlink(missing_ok=True)
+
+
 ##
 
 
-def run_prettier(path: PathLike, /) -> None:
+@dataclass(kw_only=True, slots=True)
+class PythonTransform:
+    func: Callable[[Module], Module] | None = None
+    transformer: Callable[[], CSTTransformer] | None = None
+    prefilter: Callable[[bytes], bool] | None = None
+
+    def matches(self, data: bytes, /) -> bool:
+        return (self.prefilter is None) or self.prefilter(data)
+
+
+def run_python_transforms(
+    *paths: PathLike,
+    transforms: Sequence[PythonTransform],
+    modifications: MutableSet[Path] | None = None,
+    max_workers: int | None = None,
+    min_batch: int = 64,
+) -> None:
+    paths_use = list(map(Path, paths))
+    n = (cpu_count() or 1) if max_workers is None else max_workers
+    if (n <= 1) or (len(paths_use) < min_batch):
+        results = [_transform_python_files(paths_use, transforms)]
+    else:
+        size = ceil(len(paths_use) / n)
+        chunks = [paths_use[i : i + size] for i in range(0, len(paths_use), size)]
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            results = list(
+                pool.map(_transform_python_files, chunks, repeat(transforms))
+            )
+    for modified in results:
+        for path in modified:
+            add_modification(path, modifications=modifications)
+
+
+def _transform_python_files(
+    paths: Sequence[Path], transforms: Sequence[PythonTransform], /
+) -> set[Path]:
+    modifications: set[Path] = set()
+    for path in paths:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        active = [t for t in transforms if t.matches(data)]
+        if len(active) == 0:
+            continue
+        with yield_python_file(path, modifications=modifications) as context:
+            module = context.input
+            for transform in active:
+                if transform.func is not None:
+                    module = transform.func(module)
+                if transform.transformer is not None:
+                    module = module.visit(transform.transformer())
+            context.output = module
+    return modifications
+
+
+##
+
+
+_PRETTIER_QUEUE: set[Path] = set()
+_TAPLO_QUEUE: set[Path] = set()
+_QUEUE_LOCK = Lock()
+
+
+def queue_prettier(path: PathLike, /) -> None:
+    with _QUEUE_LOCK:
+        _PRETTIER_QUEUE.add(Path(path).resolve())
+
+
+def queue_taplo(path: PathLike, /) -> None:
+    with _QUEUE_LOCK:
+        _TAPLO_QUEUE.add(Path(path).resolve())
+
+
+def run_formatters() -> None:
+    for queue, func in [(_PRETTIER_QUEUE, run_prettier), (_TAPLO_QUEUE, run_taplo)]:
+        with _QUEUE_LOCK:
+            paths = sorted(p for p in queue if p.is_file())
+            queue.clear()
+        if len(paths) >= 1:
+            func(*paths)
+
+
+def run_prettier(*paths: PathLike) -> None:
+    from utilities.subprocess import RunError, run
+
     with suppress(RunError):
-        run("prettier", "-w", str(path))
+        run("prettier", "-w", *map(str, paths))
+
 
+def run_taplo(*paths: PathLike) -> None:
+    from utilities.subprocess import RunError, run
 
-def run_taplo(path: PathLike, /) -> None:
     with suppress(RunError):
         run(
             "taplo",
@@ -511,7 +899,7 @@ def run_taplo(path: PathLike, /) -> None:
             "--option=indent_tables=true",
             "--option=indent_entries=true",
             "--option=reorder_keys=true",
-            str(path),
+            *map(str, paths),
         )
 
 
@@ -519,7 +907,300 @@ def run_taplo(path: PathLike, /) -> None:
 
 
 def set_version(version: Version3, /, *, path: PathLike = BUMPVERSION_TOML) -> None:
-    run("bump-my-version", "replace", "--new-version", str(version), str(path))
+    try:
+        texts = _get_version_replacements(version, path=path)
+    except _SetVersionUnsupportedError:
+        from utilities.subprocess import run
+
+        run("bump-my-version", "replace", "--new-version", str(version), str(path))
+        return
+    for path_i, (old, new) in texts.items():
+        if new != old:
+            write_text(path_i, new, overwrite=True)
+
+
+def _get_version_replacements(
+    version: Version3, /, *, path: PathLike = BUMPVERSION_TOML
+) -> dict[Path, tuple[str, str]]:
+    import tomllib
+
+    try:
+        bumpversion = read_toml_dict(path)["tool"]["bumpversion"]
+        current = Version3.parse(bumpversion["current_version"])
+    except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError, Version3Error):
+        raise _SetVersionUnsupportedError from None
+    if not set(bumpversion).issubset(_BUMPVERSION_KEYS):
+        raise _SetVersionUnsupportedError
+    context = {"current_version": str(current), "new_version": str(version)}
+    text = read_text(path)
+    new, n = re.subn(
+        rf"^(\s*current_version\s*=\s*[\"']){re.escape(str(current))}(?=[\"'])",
+        rf"\g<1>{version}",
+        text,
+        count=1,
+        flags=re.MULTILINE,
+    )
+    if n == 0:
+        raise _SetVersionUnsupportedError
+    out: dict[Path, tuple[str, str]] = {Path(path): (text, new)}
+    for file in bumpversion.get("files", []):
+        if not (isinstance(file, dict) and set(file).issubset(_BUMPVERSION_FILE_KEYS)):
+            raise _SetVersionUnsupportedError
+        search = _format_version_template(
+            file.get("search", "{current_version}"), context
+        )
+        replace = _format_version_template(
+            file.get("replace", "{new_version}"), context
+        )
+        path_i = Path(file["filename"])
+        if path_i not in out:
+            try:
+                text = read_text(path_i)
+            except ReadTextError:
+                msg = f"Unable to read {str(path_i)!r}"
+                raise ValueError(msg) from None
+            out[path_i] = (text, text)
+        old, new = out[path_i]
+        if search not in new:
+            msg = f"Unable to find {search!r} in {str(path_i)!r}"
+            raise ValueError(msg)
+        out[path_i] = (old, new.replace(search, replace))
+    return out
+
+
+def _format_version_template(template: Any, context: StrDict, /) -> str:
+    if not isinstance(template, str):
+        raise _SetVersionUnsupportedError
+    for _, name, spec, conversion in Formatter().parse(template):
+        if (name is not None) and ((name not in context) or spec or conversion):
+            raise _SetVersionUnsupportedError
+    return template.format(**context)
+
+
+_BUMPVERSION_KEYS = {"allow_dirty", "current_version", "files"}
+_BUMPVERSION_FILE_KEYS = {"filename", "replace", "search"}
+
+
+class _SetVersionUnsupportedError(Exception): ...
+
+
+##
+
+
+@dataclass(kw_only=True, slots=True)
+class Tracker:
+    changes: list[str] = field(default_factory=list)
+
+    @property
+    def dirty(self) -> bool:
+        return len(self.changes) >= 1
+
+    def record(self, op: str, key: Any = None, /) -> None:
+        self.changes.append(op if key is None else f"{op} {key!r}")
+
+    def is_unchanged(self, old: Any, new: Any, /) -> bool:
+        return _is_unchanged(old, new)
+
+
+def track(obj: Any, tracker: Tracker, /) -> Any:
+    match obj:
+        case dict():
+            items = {k: track(v, tracker) for k, v in obj.items()}
+            return TrackedDict(items, tracker=tracker)
+        case list():
+            return TrackedList((track(v, tracker) for v in obj), tracker=tracker)
+        case _:
+            return obj
+
+
+def is_dirty(obj: Any, /) -> bool:
+    if isinstance(obj, TrackedDict | TrackedList):
+        return obj.tracker.dirty
+    return True
+
+
+def _track_as[T](container: Any, obj: T, /) -> T:
+    if isinstance(container, TrackedDict | TrackedList):
+        return track(obj, container.tracker)
+    return obj
+
+
+def _is_unchanged(old: Any, new: Any, /) -> bool:
+    if old is new:
+        return True
+    if isinstance(new, dict | list):
+        return False
+    return (type(old) is type(new)) and (old == new)
+
+
+class TrackedDict(dict[Any, Any]):
+    __slots__ = ("tracker",)
+
+    def __init__(self, *args: Any, tracker: Tracker, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.tracker = tracker
+
+    @override
+    def __setitem__(self, key: Any, value: Any, /) -> None:
+        if (key in self) and self.tracker.is_unchanged(self[key], value):
+            return
+        super().__setitem__(key, value)
+        self.tracker.record("set", key)
+
+    @override
+    def __delitem__(self, key: Any, /) -> None:
+        super().__delitem__(key)
+        self.tracker.record("delete", key)
+
+    def __deepcopy__(self, memo: dict[int, Any], /) -> StrDict:
+        return {deepcopy(k, memo): deepcopy(v, memo) for k, v in self.items()}
+
+    @override
+    def __ior__(self, other: Any, /) -> Self:
+        self.update(other)
+        return self
+
+    @override
+    def clear(self) -> None:
+        if len(self) >= 1:
+            self.tracker.record("clear")
+        super().clear()
+
+    @override
+    def pop(self, key: Any, /, *args: Any) -> Any:
+        if key in self:
+            self.tracker.record("delete", key)
+        return super().pop(key, *args)
+
+    @override
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        self.tracker.record("delete", key)
+        return key, value
+
+    @override
+    def setdefault(self, key: Any, default: Any = None, /) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+class TrackedList(list[Any]):
+    __slots__ = ("tracker",)
+
+    def __init__(self, *args: Any, tracker: Tracker) -> None:
+        super().__init__(*args)
+        self.tracker = tracker
+
+    @override
+    def __setitem__(self, index: Any, value: Any, /) -> None:
+        if isinstance(index, int) and self.tracker.is_unchanged(self[index], value):
+            return
+        super().__setitem__(index, value)
+        self.tracker.record("set", index)
+
+    @override
+    def __delitem__(self, index: Any, /) -> None:
+        super().__delitem__(index)
+        self.tracker.record("delete", index)
+
+    def __deepcopy__(self, memo: dict[int, Any], /) -> list[Any]:
+        return [deepcopy(v, memo) for v in self]
+
+    @override
+    def __iadd__(self, other: Iterable[Any], /) -> Self:
+        self.extend(other)
+        return self
+
+    @override
+    def __imul__(self, n: SupportsIndex, /) -> Self:
+        if (len(self) >= 1) and (n != 1):
+            self.tracker.record("repeat", n)
+        return super().__imul__(n)
+
+    @override
+    def append(self, value: Any, /) -> None:
+        super().append(value)
+        self.tracker.record("append", len(self) - 1)
+
+    @override
+    def clear(self) -> None:
+        if len(self) >= 1:
+            self.tracker.record("clear")
+        super().clear()
+
+    @override
+    def extend(self, values: Iterable[Any], /) -> None:
+        n = len(self)
+        super().extend(values)
+        if len(self) > n:
+            self.tracker.record("extend", n)
+
+    @override
+    def insert(self, index: SupportsIndex, value: Any, /) -> None:
+        super().insert(index, value)
+        self.tracker.record("insert", index)
+
+    @override
+    def pop(self, index: SupportsIndex = -1, /) -> Any:
+        value = super().pop(index)
+        self.tracker.record("delete", index)
+        return value
+
+    @override
+    def remove(self, value: Any, /) -> None:
+        super().remove(value)
+        self.tracker.record("remove", value)
+
+    @override
+    def reverse(self) -> None:
+        before = list(map(id, self))
+        super().reverse()
+        if list(map(id, self)) != before:
+            self.tracker.record("reverse")
+
+    @override
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        before = list(map(id, self))
+        super().sort(*args, **kwargs)
+        if list(map(id, self)) != before:
+            self.tracker.record("sort")
+
+
+class _ProbeTracker(Tracker):
+    __slots__ = ()
+
+    @override
+    def record(self, op: str, key: Any = None, /) -> None:
+        raise _ProbeChangeError(op if key is None else f"{op} {key!r}")
+
+    @override
+    def is_unchanged(self, old: Any, new: Any, /) -> bool:
+        return _is_equal_strict(old, new)
+
+
+def _is_equal_strict(old: Any, new: Any, /) -> bool:
+    match old, new:
+        case Mapping(), Mapping():
+            return (old.keys() == new.keys()) and all(
+                _is_equal_strict(old[k], new[k]) for k in old
+            )
+        case list(), list():
+            return (len(old) == len(new)) and all(map(_is_equal_strict, old, new))
+        case _:
+            return (
+                isinstance(new, type(old))
+                and (isinstance(old, bool) is isinstance(new, bool))
+                and (old == new)
+            )
+
+
+class _ProbeChangeError(Exception): ...
 
 
 ##
@@ -528,6 +1209,9 @@ def set_version(version: Version3, /, *, path: PathLike = BUMPVERSION_TOML) -> N
 def uv_index_credentials(
     *, username: str | None = None, password: SecretLike | None = None
 ) -> tuple[str, str] | None:
+    from pydantic import SecretStr
+    from utilities.pydantic import extract_secret
+
     match username, password:
         case str(), SecretStr() | str():
             return (username, extract_secret(password))
@@ -558,18 +1242,41 @@ def yield_immutable_write_context[T](
     *,
     modifications: MutableSet[Path] | None = None,
     is_equal: Callable[[T, T], bool] = eq,
+    copy: Callable[[T], T] = deepcopy,
+    is_dirty: Callable[[T], bool] | None = None,
+    cache_kind: str | None = None,
 ) -> Iterator[_WriteContext[T]]:
+    if _DOCUMENT_CACHE.active:
+        if cache_kind is not None:
+            with _yield_cached_write_context(
+                path,
+                loads,
+                get_default,
+                dumps,
+                modifications=modifications,
+                is_equal=is_equal,
+                kind=cache_kind,
+            ) as context:
+                yield context
+            return
+        _DOCUMENT_CACHE.evict(path)
     try:
         current = read_text(path)
     except ReadTextError:
         current = None
         input_ = get_default()
-        output = get_default()
     else:
         input_ = loads(current)
-        output = loads(current)
-    yield (context := _WriteContext(input=input_, output=output))
-    if (current is None) or not is_equal(context.output, loads(current)):
+    yield (context := _WriteContext(input=input_, output=copy(input_)))
+    if current is None:
+        write = True
+    elif is_dirty is not None:
+        write = is_dirty(context.output) and not is_equal(
+            context.output, loads(current)
+        )
+    else:
+        write = (context.output is not input_) and not is_equal(context.output, input_)
+    if write:
         write_text_and_add_modification(
             path, dumps(context.output), modifications=modifications
         )
@@ -584,12 +1291,143 @@ class _WriteContext[T]:
 ##
 
 
+@contextmanager
+def yield_document_cache() -> Iterator[None]:
+    if _DOCUMENT_CACHE.active:
+        yield
+        return
+    _DOCUMENT_CACHE.active = True
+    try:
+        yield
+    finally:
+        _DOCUMENT_CACHE.flush()
+        _DOCUMENT_CACHE.active = False
+        _DOCUMENT_CACHE.entries.clear()
+
+
+@contextmanager
+def _yield_cached_write_context[T](
+    path: PathLike,
+    loads: Callable[[str], T],
+    get_default: Callable[[], T],
+    dumps: Callable[[T], str],
+    /,
+    *,
+    modifications: MutableSet[Path] | None = None,
+    is_equal: Callable[[T, T], bool] = eq,
+    kind: str,
+) -> Iterator[_WriteContext[T]]:
+    entry = _DOCUMENT_CACHE.get(path, kind=kind)
+    if entry is None:
+        try:
+            value = loads(read_text(path))
+        except ReadTextError:
+            value, exists = get_default(), False
+        else:
+            exists = True
+        entry = _DOCUMENT_CACHE.set(
+            path, _CachedDocument(kind=kind, value=value, dumps=dumps, exists=exists)
+        )
+    context = _WriteContext(input=entry.value, output=entry.value)
+    try:
+        yield context
+    except BaseException:
+        _DOCUMENT_CACHE.evict(path)
+        raise
+    text = dumps(context.output)
+    if entry.exists and (text == entry.text):
+        entry.value = context.output
+    elif entry.exists and is_equal(context.output, persisted := loads(entry.text)):
+        entry.value = persisted
+    else:
+        entry.value, entry.text = context.output, text
+        entry.exists = entry.dirty = True
+        add_modification(path, modifications=modifications)
+
+
+@dataclass(kw_only=True, slots=True)
+class _CachedDocument:
+    kind: str
+    value: Any
+    dumps: Callable[[Any], str]
+    exists: bool = True
+    text: str = field(init=False)
+    stat: tuple[int, int] | None = None
+    dirty: bool = False
+
+    def __post_init__(self) -> None:
+        self.text = self.dumps(self.value)
+
+
+@dataclass(kw_only=True, slots=True)
+class _DocumentCache:
+    active: bool = False
+    entries: dict[Path, _CachedDocument] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock)
+
+    def get(self, path: PathLike, /, *, kind: str) -> _CachedDocument | None:
+        key = Path(path).resolve()
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if (entry.kind != kind) or (
+            (not entry.dirty) and (entry.stat != _get_stat(key))
+        ):
+            self.evict(key)
+            return None
+        return entry
+
+    def set(self, path: PathLike, entry: _CachedDocument, /) -> _CachedDocument:
+        key = Path(path).resolve()
+        entry.stat = _get_stat(key)
+        with self.lock:
+            self.entries[key] = entry
+        return entry
+
+    def evict(self, path: PathLike, /) -> None:
+        key = Path(path).resolve()
+        with self.lock:
+            entry = self.entries.pop(key, None)
+        if (entry is not None) and entry.dirty:
+            write_text(key, entry.text, overwrite=True)
+
+    def flush(self) -> None:
+        with self.lock:
+            entries = list(self.entries.items())
+        for path, entry in entries:
+            if entry.dirty:
+                write_text(path, entry.text, overwrite=True)
+                entry.dirty, entry.stat = False, _get_stat(path)
+
+
+def _get_stat(path: Path, /) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+_DOCUMENT_CACHE = _DocumentCache()
+
+
+##
+
+
 @contextmanager
 def yield_json_dict(
     path: PathLike, /, *, modifications: MutableSet[Path] | None = None
 ) -> Iterator[StrDict]:
+    tracker = Tracker()
     with yield_mutable_write_context(
-        path, json.loads, dict, json.dumps, modifications=modifications
+        path,
+        lambda text: track(_load_json(text), tracker),
+        dict,
+        json.dumps,
+        modifications=modifications,
+        copy=identity,
+        is_dirty=is_dirty,
     ) as dict_:
         yield dict_
 
@@ -607,9 +1445,20 @@ def yield_mutable_write_context[T](
     *,
     modifications: MutableSet[Path] | None = None,
     is_equal: Callable[[T, T], bool] = eq,
+    copy: Callable[[T], T] = deepcopy,
+    is_dirty: Callable[[T], bool] | None = None,
+    cache_kind: str | None = None,
 ) -> Iterator[T]:
     with yield_immutable_write_context(
-        path, loads, get_default, dumps, modifications=modifications, is_equal=is_equal
+        path,
+        loads,
+        get_default,
+        dumps,
+        modifications=modifications,
+        is_equal=is_equal,
+        copy=copy,
+        is_dirty=is_dirty,
+        cache_kind=cache_kind,
     ) as context:
         yield context.output
 
@@ -621,6 +1470,8 @@ def yield_mutable_write_context[T](
 def yield_python_file(
     path: PathLike, /, *, modifications: MutableSet[Path] | None = None
 ) -> Iterator[_WriteContext[Module]]:
+    from libcst import Module, parse_module
+
     def is_equal(x: Module, y: Module, /) -> bool:
         return are_equal_modulo_new_line(x.code, y.code)
 
@@ -631,6 +1482,7 @@ def yield_python_file(
         lambda module: module.code,
         modifications=modifications,
         is_equal=is_equal,
+        copy=identity,
     ) as context:
         yield context
 
@@ -649,6 +1501,7 @@ def yield_text_file(
         str,
         modifications=modifications,
         is_equal=are_equal_modulo_new_line,
+        copy=identity,
     ) as context:
         yield context
 
@@ -665,6 +1518,9 @@ def yield_toml_doc(
     is_equal: Callable[[TOMLDocument, TOMLDocument], bool] = eq,
     taplo: Callable[[], bool] = lambda: not is_pytest(),
 ) -> Iterator[TOMLDocument]:
+    import tomlkit
+    from tomlkit import document
+
     with yield_mutable_write_context(
         path,
         tomlkit.parse,
@@ -672,10 +1528,43 @@ def yield_toml_doc(
         tomlkit.dumps,
         modifications=modifications,
         is_equal=is_equal,
+        cache_kind="toml",
     ) as doc:
         yield doc
     if taplo():
-        run_taplo(path)
+        queue_taplo(path)
+
+
+def update_toml_doc(
+    path: PathLike,
+    func: Callable[[TOMLDocument], None],
+    /,
+    *,
+    modifications: MutableSet[Path] | None = None,
+    taplo: Callable[[], bool] = lambda: not is_pytest(),
+) -> None:
+    if _is_toml_unchanged(path, func):
+        if taplo():
+            queue_taplo(path)
+        return
+    with yield_toml_doc(path, modifications=modifications, taplo=taplo) as doc:
+        func(doc)
+
+
+def _is_toml_unchanged(path: PathLike, func: Callable[[TOMLDocument], None], /) -> bool:
+    if Path(path).resolve() in _DOCUMENT_CACHE.entries:
+        return False
+    import tomllib
+
+    try:
+        dict_ = read_toml_dict(path)
+    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        return False
+    try:
+        func(track(dict_, _ProbeTracker()))
+    except (_ProbeChangeError, KeyError, TypeError):
+        return False
+    return True
 
 
 ##
@@ -716,23 +1605,72 @@ def yield_yaml_dict(
     modifications: MutableSet[Path] | None = None,
     prettier: Callable[[], bool] = lambda: not is_pytest(),
 ) -> Iterator[StrDict]:
+    import yaml
+
+    tracker = Tracker()
     with yield_mutable_write_context(
         path,
-        yaml.safe_load,
-        dict,
-        partial(yaml.safe_dump, sort_keys=False),
+        lambda text: track(load_yaml(text), tracker),
+        partial(TrackedDict, tracker=tracker),
+        partial(yaml.dump, Dumper=_get_yaml_dumper(), sort_keys=False),
         modifications=modifications,
+        copy=identity,
+        is_dirty=is_dirty,
+        cache_kind="yaml",
     ) as dict_:
         yield dict_
     if prettier():
-        run_prettier(path)
+        queue_prettier(path)
+
+
+def load_yaml(text: str, /) -> Any:
+    import yaml
+
+    return yaml.load(text, Loader=_get_yaml_loader())  # noqa: S506
 
 
 ##
 
 
+def _load_json(text: str, /) -> Any:
+    import orjson
+
+    if re.search(r"\d{19}", text):
+        return json.loads(text)
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+@cache
+def _get_yaml_dumper() -> type[SafeDumper]:
+    from yaml import SafeDumper
+
+    class Dumper(SafeDumper): ...
+
+    Dumper.add_representer(TrackedDict, Dumper.represent_dict)
+    Dumper.add_representer(TrackedList, Dumper.represent_list)
+    return Dumper
+
+
+@cache
+def _get_yaml_loader() -> type[SafeLoader | CSafeLoader]:
+    try:
+        from yaml import CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader
+    return CSafeLoader
+
+
 __all__ = [
     "PyProjectDependencies",
+    "PythonTransform",
+    "TrackedDict",
+    "TrackedList",
+    "Tracker",
     "add_update_certificates",
     "are_equal_modulo_new_line",
     "ensure_contains",
@@ -760,19 +1698,30 @@ __all__ = [
     "get_version_from_path",
     "get_version_origin_master",
     "get_version_set",
+    "is_dirty",
+    "load_yaml",
     "merge_paths",
     "path_throttle_cache",
+    "queue_prettier",
+    "queue_taplo",
     "re_insert_array",
     "re_insert_dict",
     "re_insert_hook_dict",
     "re_insert_table",
+    "read_toml_dict",
     "run_all",
     "run_all_maybe_raise",
+    "run_cached",
+    "run_formatters",
     "run_prettier",
+    "run_python_transforms",
     "run_taplo",
     "set_version",
+    "track",
+    "update_toml_doc",
     "uv_index_credentials",
     "write_text_and_add_modification",
+    "yield_document_cache",
     "yield_immutable_write_context",
     "yield_json_dict",
     "yield_mutable_write_context",
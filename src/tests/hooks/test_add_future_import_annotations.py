@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pytest import mark, param
 from utilities.core import normalize_multi_line_str, read_text
 
-from pre_commit_hooks.hooks.add_future_import_annotations import _run
+from pre_commit_hooks.hooks.add_future_import_annotations import _prefilter, _run
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -19,3 +20,17 @@ class TestFormatPath:
         for i in range(2):
             assert _run(path, throttle=False) is (i >= 1)
             assert read_text(path) == expected
+
+
+class TestPrefilter:
+    @mark.parametrize(
+        ("data", "expected"),
+        [
+            param(b"", True),
+            param(b"# comment\n\n", True),
+            param(b"x = 1\n", False),
+            param(b'"""docstring"""\n', False),
+        ],
+    )
+    def test_main(self, *, data: bytes, expected: bool) -> None:
+        assert _prefilter(data) is expected
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING
 
 from pytest import mark, param
 from utilities.constants import HOUR
+from utilities.functions import ensure_class
 from utilities.pytest import throttle_test
 
+import pre_commit_hooks.utilities
 from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML
-from pre_commit_hooks.hooks.add_hooks import _run, _to_read_url
+from pre_commit_hooks.hooks.add_hooks import (
+    _add_ruff_check,
+    _add_ruff_format,
+    _run,
+    _Session,
+    _to_read_url,
+)
+from pre_commit_hooks.utilities import TrackedDict, yield_yaml_dict
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest import MonkeyPatch
+    from utilities.types import PathLike
+
 
 class TestAddHooks:
     @throttle_test(duration=HOUR)
@@ -23,6 +36,32 @@ class TestAddHooks:
             assert result is expected
             assert path.is_file()
 
+    def test_single_write(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        writes: Counter[PathLike] = Counter()
+        write_text = pre_commit_hooks.utilities.write_text
+
+        def counting(path: PathLike, text: str, /, **kwargs: bool) -> None:
+            writes[path] += 1
+            write_text(path, text, **kwargs)
+
+        monkeypatch.setattr(pre_commit_hooks.utilities, "write_text", counting)
+        path = tmp_path / PRE_COMMIT_CONFIG_YAML
+        assert not _run(path=path, python=True, ci_github=True)
+        assert writes == {path: 1}
+        writes.clear()
+        assert _run(path=path, python=True, ci_github=True)
+        assert writes == {}
+
+    def test_session(self, *, tmp_path: Path) -> None:
+        path = tmp_path / PRE_COMMIT_CONFIG_YAML
+        for i in range(2):
+            with yield_yaml_dict(path) as dict_:
+                session = _Session(path=path, dict_=ensure_class(dict_, TrackedDict))
+                expected = i >= 1
+                assert _add_ruff_check(session=session) is expected
+                assert _add_ruff_format(session=session) is expected
+                assert _add_ruff_check(session=session)
+
 
 class TestToReadURL:
     @mark.parametrize(
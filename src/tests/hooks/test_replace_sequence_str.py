@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pytest import mark, param
 from utilities.core import normalize_multi_line_str, read_text
 
-from pre_commit_hooks.hooks.replace_sequence_str import _run
+from pre_commit_hooks.hooks.replace_sequence_str import _prefilter, _run
 from pre_commit_hooks.utilities import write_text_and_add_modification
 
 if TYPE_CHECKING:
@@ -28,3 +29,17 @@ class TestRun:
         for i in range(2):
             assert _run(path) is (i >= 1)
             assert read_text(path) == expected
+
+
+class TestPrefilter:
+    @mark.parametrize(
+        ("data", "expected"),
+        [
+            param(b"x: Sequence[str]", True),
+            param(b"x: Sequence[ str ]", True),
+            param(b"x: list[str]", False),
+            param(b"x: Sequence[int]", False),
+        ],
+    )
+    def test_main(self, *, data: bytes, expected: bool) -> None:
+        assert _prefilter(data) is expected
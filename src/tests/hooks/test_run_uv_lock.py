@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from utilities.core import normalize_multi_line_str, write_text
+from utilities.version import Version2, Version3
+
+from pre_commit_hooks.hooks.run_uv_lock import (
+    _find_lock,
+    _get_freshness_key,
+    _get_locked_versions,
+    _get_pinned,
+    _is_cli_consistent,
+    _is_fresh,
+    _path_freshness,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestFreshness:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = path.write_text('[project]\ndependencies = ["click>=8"]\n')
+        _ = (tmp_path / "uv.lock").write_text("version = 1\n")
+        (tmp_path / ".venv").mkdir()
+        root = tmp_path / "cache"
+        key = _get_freshness_key(path)
+        assert key is not None
+        assert not _is_fresh(path, key=key, root=root)
+        write_text(_path_freshness(path, root=root), key)
+        assert _is_fresh(path, key=key, root=root)
+        assert not _is_fresh(path, key=key, ttl=-1, root=root)
+        _ = (tmp_path / "uv.lock").write_text("version = 2\n")
+        assert not _is_fresh(path, key=_get_freshness_key(path), root=root)
+
+    def test_key(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = path.write_text('[project]\ndependencies = ["click>=8"]\n')
+        assert _get_freshness_key(path) is None
+        _ = (tmp_path / "uv.lock").write_text("version = 1\n")
+        key1 = _get_freshness_key(path)
+        key2 = _get_freshness_key(path, index="https://example.com/simple")
+        _ = path.write_text('[project]\ndependencies = ["click>=9"]\n')
+        key3 = _get_freshness_key(path)
+        assert len({key1, key2, key3}) == 3
+
+
+class TestFindLock:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / "uv.lock").write_text(_LOCK)
+        assert _find_lock(tmp_path / "pyproject.toml") == tmp_path / "uv.lock"
+
+    def test_workspace(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / "pyproject.toml").write_text(
+            '[tool.uv.workspace]\nmembers = ["packages/*"]\n'
+        )
+        _ = (tmp_path / "uv.lock").write_text(_LOCK)
+        member = tmp_path / "packages" / "member"
+        member.mkdir(parents=True)
+        assert _find_lock(member / "pyproject.toml") == tmp_path / "uv.lock"
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        assert _find_lock(tmp_path / "pyproject.toml") is None
+
+
+class TestGetLockedVersions:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / "uv.lock").write_text(_LOCK)
+        result = _get_locked_versions(tmp_path / "uv.lock")
+        assert result == {"click": Version3(8, 1, 0), "tzdata": Version2(2025, 2)}
+
+    def test_forked(self, *, tmp_path: Path) -> None:
+        lock = _LOCK + '\n[[package]]\nname = "click"\nversion = "7.1.2"\n'
+        _ = (tmp_path / "uv.lock").write_text(lock)
+        result = _get_locked_versions(tmp_path / "uv.lock")
+        assert result == {"click": None, "tzdata": Version2(2025, 2)}
+
+
+class TestGetPinned:
+    def test_main(self) -> None:
+        versions = {"click": None, "tzdata": Version2(2025, 2)}
+        result = _get_pinned(["click>=7", "tzdata>=2025", "other"], versions=versions)
+        assert list(result) == ["click>=7", "tzdata==2025.2"]
+
+
+class TestIsCLIConsistent:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = (tmp_path / "uv.lock").write_text(_LOCK)
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                [project]
+                dependencies = ["Click>=8, <9"]
+                [project.optional-dependencies]
+                cli = ["Click==8.1.0"]
+            """)
+        )
+        assert _is_cli_consistent(path)
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                [project]
+                dependencies = ["tzdata>=2025", "click>=8"]
+                [project.optional-dependencies]
+                cli = ["click==8.1.0", "tzdata==2025.2"]
+            """)
+        )
+        assert _is_cli_consistent(path)
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                [project]
+                dependencies = ["click>=8, <9"]
+                [project.optional-dependencies]
+                cli = ["click==8.0.0"]
+            """)
+        )
+        assert not _is_cli_consistent(path)
+
+    def test_no_lock(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = path.write_text('[project]\ndependencies = ["click>=8, <9"]\n')
+        assert not _is_cli_consistent(path)
+
+
+_LOCK = """\
+version = 1
+
+[[package]]
+name = "click"
+version = "8.1.0"
+
+[[package]]
+name = "other"
+source = { editable = "." }
+
+[[package]]
+name = "tzdata"
+version = "2025.2"
+"""
@@ -17,3 +17,11 @@ class TestSetupBumpMyVersion:
             expected = i >= 1
             assert result is expected
             assert path.is_file()
+
+    def test_options(self, *, tmp_path: Path) -> None:
+        path = tmp_path / BUMPVERSION_TOML
+        for i in range(2):
+            result = _run(path=path, package_name="package_name")
+            expected = i >= 1
+            assert result is expected
+        assert "src/package_name/__init__.py" in path.read_text()
@@ -7,7 +7,8 @@ from pytest import mark, param
 from utilities.core import normalize_multi_line_str
 
 from pre_commit_hooks.constants import ENVRC
-from pre_commit_hooks.hooks.setup_direnv import _get_text, _run
+from pre_commit_hooks.hooks.setup_direnv import _run
+from pre_commit_hooks.templates import get_template
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -17,7 +18,7 @@ if TYPE_CHECKING:
 
 class TestGetText:
     def test_main(self) -> None:
-        result = _get_text()
+        result = get_template("direnv-python")
         expected = normalize_multi_line_str("""
             # uv
             export UV_MANAGED_PYTHON='true'
@@ -40,8 +41,11 @@ class TestGetText:
 
     @mark.parametrize("password", [param("password"), param(SecretStr("password"))])
     def test_index(self, *, password: SecretLike) -> None:
-        result = _get_text(
-            index_name="name", index_username="username", index_password=password
+        result = get_template(
+            "direnv-python",
+            index_name="name",
+            index_username="username",
+            index_password=password,
         )
         expected = normalize_multi_line_str("""
             # uv
@@ -66,7 +70,7 @@ class TestGetText:
         assert result == expected
 
     def test_native_tls(self) -> None:
-        result = _get_text(native_tls=True)
+        result = get_template("direnv-python", native_tls=True)
         expected = normalize_multi_line_str("""
             # uv
             export UV_MANAGED_PYTHON='true'
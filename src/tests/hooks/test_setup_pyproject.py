@@ -17,3 +17,13 @@ class TestSetupPyProject:
             expected = i >= 1
             assert result is expected
             assert path.is_file()
+
+    def test_options(self, *, tmp_path: Path) -> None:
+        path = tmp_path / PYPROJECT_TOML
+        for i in range(2):
+            result = _run(
+                path=path, description="description", name_external="package_name"
+            )
+            expected = i >= 1
+            assert result is expected
+        assert 'description = "description"' in path.read_text()
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pytest import raises
 from utilities.core import normalize_multi_line_str, read_text
+from utilities.subprocess import run
 
-from pre_commit_hooks.hooks.update_ci_action_versions import _run
+from pre_commit_hooks.hooks.update_ci_action_versions import (
+    _get_versions,
+    _resolve_versions,
+    _run,
+)
 from pre_commit_hooks.utilities import write_text_and_add_modification
 
 if TYPE_CHECKING:
@@ -28,3 +34,85 @@ class TestUpdateCIActionVersions:
         for i in range(2):
             assert _run(path) is (i >= 1)
             assert read_text(path) == expected
+
+    def test_custom(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "action.yaml"
+        input_ = normalize_multi_line_str("""
+            steps:
+              - uses: actions/checkout@v5
+              - uses: owner/action@v1
+              - uses: owner/action-other@v1
+        """)
+        write_text_and_add_modification(path, input_)
+        versions = {"actions/checkout": "v6", "owner/action": "v2"}
+        assert not _run(path, versions=versions)
+        expected = normalize_multi_line_str("""
+            steps:
+              - uses: actions/checkout@v6
+              - uses: owner/action@v2
+              - uses: owner/action-other@v1
+        """)
+        assert read_text(path) == expected
+
+
+class TestGetVersions:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                [tool.pre-commit-hooks.action-versions]
+                "owner/action1" = "v1"
+                "owner/action2" = "v1"
+            """)
+        )
+        result = _get_versions(action_versions=["owner/action2@v2"], path=path)
+        assert result["actions/checkout"] == "v6"
+        assert result["owner/action1"] == "v1"
+        assert result["owner/action2"] == "v2"
+
+    def test_error(self, *, tmp_path: Path) -> None:
+        with raises(ValueError, match=r"Invalid action version; got 'action'"):
+            _ = _get_versions(action_versions=["action"], path=tmp_path / "none")
+
+
+class TestResolveVersions:
+    def test_mirrors(self, *, tmp_path: Path) -> None:
+        mirror = tmp_path / "mirrors" / "owner" / "action"
+        mirror.mkdir(parents=True)
+        _ = run("git", "init", "-q", cwd=mirror)
+        _ = run(
+            "git",
+            "-c",
+            "user.name=name",
+            "-c",
+            "user.email=email",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "message",
+            cwd=mirror,
+        )
+        for tag in ["v1", "v2.1.0", "v10", "other"]:
+            _ = run("git", "tag", tag, cwd=mirror)
+        cache = tmp_path / "cache.json"
+        result = _resolve_versions(
+            cache=cache, mirrors=tmp_path / "mirrors", actions=["owner/action"]
+        )
+        assert result == {"owner/action": "v10"}
+        assert _resolve_versions(cache=cache) == result
+
+    def test_snapshot(self, *, tmp_path: Path) -> None:
+        snapshot = tmp_path / "snapshot.json"
+        _ = snapshot.write_text('{"owner/action": "v3"}')
+        cache = tmp_path / "cache.json"
+        result = _resolve_versions(cache=cache, snapshot=snapshot)
+        assert result == {"owner/action": "v3"}
+
+    def test_expired(self, *, tmp_path: Path) -> None:
+        cache = tmp_path / "cache.json"
+        _ = cache.write_text('{"owner/action": "v3"}')
+        snapshot = tmp_path / "snapshot.json"
+        _ = snapshot.write_text('{"owner/action": "v4"}')
+        result = _resolve_versions(cache=cache, snapshot=snapshot, ttl=-1)
+        assert result == {"owner/action": "v4"}
@@ -98,5 +98,14 @@ class TestRun:
         if latest is not None:
             versions[req.name] = latest
         for i in range(2):
-            assert _run(path=path, versions=versions) is ((i >= 1) or expected)
+            assert _run(path=path, versions=lambda: versions) is ((i >= 1) or expected)
             assert read_text(path) == exp_output
+
+    def test_lazy(self, *, tmp_path: Path) -> None:
+        path = tmp_path / PYPROJECT_TOML
+        write_text_and_add_modification(path, '[project]\nname = "name"\n')
+
+        def versions() -> VersionSet:
+            raise AssertionError
+
+        assert _run(path=path, versions=versions)
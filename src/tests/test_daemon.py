@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import socket
+import sys
+from contextlib import contextmanager, suppress
+from subprocess import Popen
+from threading import Event, Thread
+from time import sleep
+from typing import TYPE_CHECKING
+
+from pytest import mark, param
+
+import pre_commit_hooks.daemon
+from pre_commit_hooks.daemon import _exit_code, _yield_request_context, run_hook
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+class TestExitCode:
+    @mark.parametrize(
+        ("code", "expected"), [param(None, 0), param(0, 0), param(2, 2), param("", 1)]
+    )
+    def test_main(self, *, code: int | str | None, expected: int) -> None:
+        assert _exit_code(SystemExit(code)) == expected
+
+
+class TestRunHook:
+    def test_fallback(self, *, tmp_path: Path) -> None:
+        result = run_hook("setup-git", [], socket_=tmp_path / "daemon.sock")
+        assert result == 0
+
+    def test_round_trip(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        self._disable_fallback(monkeypatch)
+        path = tmp_path / "daemon.sock"
+        with _yield_daemon(path, cwd=tmp_path):
+            assert run_hook("setup-git", [], socket_=path) == 0
+            assert run_hook("setup-git", ["--invalid"], socket_=path) == 2
+
+    def test_throttle_per_repo(
+        self, *, monkeypatch: MonkeyPatch, tmp_path: Path
+    ) -> None:
+        self._disable_fallback(monkeypatch)
+        monkeypatch.delenv("PYTEST_VERSION")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        path = tmp_path / "daemon.sock"
+        (daemon := tmp_path / "daemon").mkdir()
+        repos = [tmp_path / "repo1", tmp_path / "repo2"]
+        with _yield_daemon(path, cwd=daemon):
+            for repo in repos:
+                repo.mkdir()
+                _ = (repo / "file.py").write_text("")
+                monkeypatch.chdir(repo)
+                hook = "add-future-import-annotations"
+                assert run_hook(hook, ["file.py"], socket_=path) == 1
+        for repo in repos:
+            text = (repo / "file.py").read_text()
+            assert text == "from __future__ import annotations\n"
+
+    def test_empty_response(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        self._disable_fallback(monkeypatch)
+        path = tmp_path / "daemon.sock"
+        with _yield_server(path, lambda conn: conn.close()):
+            assert run_hook("setup-git", [], socket_=path) == 1
+
+    def test_timeout(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        self._disable_fallback(monkeypatch)
+        path = tmp_path / "daemon.sock"
+        event = Event()
+        with _yield_server(path, lambda _: event.wait()):
+            assert run_hook("setup-git", [], socket_=path, timeout=0.1) == 1
+        event.set()
+
+    def _disable_fallback(self, monkeypatch: MonkeyPatch, /) -> None:
+        def run_in_process(*_: object) -> int:
+            raise AssertionError
+
+        monkeypatch.setattr(pre_commit_hooks.daemon, "run_in_process", run_in_process)
+
+
+class TestYieldRequestContext:
+    def test_env(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("DAEMON_ONLY", "1")
+        fds = [os.dup(1), os.dup(2)]
+        try:
+            env = {"HTTPS_PROXY": "http://proxy:3128"}
+            with _yield_request_context(fds, cwd=str(tmp_path), env=env):
+                inner = dict(os.environ)
+        finally:
+            for fd in fds:
+                os.close(fd)
+        assert inner == env
+        assert os.environ["DAEMON_ONLY"] == "1"
+
+
+@contextmanager
+def _yield_daemon(path: Path, /, *, cwd: Path) -> Iterator[None]:
+    code = "; ".join([
+        "from pathlib import Path",
+        "from pre_commit_hooks.daemon import serve",
+        f"serve(socket_=Path({str(path)!r}))",
+    ])
+    process = Popen([sys.executable, "-c", code], cwd=cwd)
+    try:
+        for _ in range(300):
+            if path.exists():
+                break
+            sleep(0.1)
+        yield
+    finally:
+        process.terminate()
+        _ = process.wait()
+
+
+@contextmanager
+def _yield_server(
+    path: Path, handle: Callable[[socket.socket], object], /
+) -> Iterator[None]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(path))
+        sock.listen()
+
+        def serve() -> None:
+            with suppress(OSError):
+                conn, _ = sock.accept()
+                _ = handle(conn)
+
+        Thread(target=serve, daemon=True).start()
+        yield
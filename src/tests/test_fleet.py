@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from utilities.core import normalize_multi_line_str
+from utilities.subprocess import run
+
+from pre_commit_hooks.constants import GITATTRIBUTES, GITIGNORE, PRE_COMMIT_CONFIG_YAML
+from pre_commit_hooks.fleet import _get_definitions, _get_files, _get_hooks, run_fleet
+from pre_commit_hooks.templates import get_template
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+_CONFIG = normalize_multi_line_str("""
+    repos:
+      - repo: https://github.com/dycw/pre-commit-hooks
+        rev: master
+        hooks:
+          - id: setup-git
+            args:
+              - --python
+          - id: setup-ruff
+      - repo: https://github.com/astral-sh/ruff-pre-commit
+        rev: master
+        hooks:
+          - id: ruff-check
+""")
+
+
+class TestGetFiles:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        names = [PRE_COMMIT_CONFIG_YAML, "pyproject.toml", "pytest.toml", "src/a.py"]
+        for name in names:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _ = path.touch()
+        monkeypatch.chdir(tmp_path)
+        _ = run("git", "init", "-q")
+        _ = run("git", "add", ".")
+        assert _get_files("format-pytest") == ["pytest.toml"]
+        assert _get_files("replace-sequence-str") == ["src/a.py"]
+        assert _get_files("run-version-bump") == []
+        assert _get_files("setup-pyproject") == [
+            str(PRE_COMMIT_CONFIG_YAML),
+            "pyproject.toml",
+        ]
+
+    def test_definitions(self) -> None:
+        assert _get_definitions()["update-requirements"]["files"] == r"pyproject\.toml$"
+
+
+class TestGetHooks:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        _ = (tmp_path / PRE_COMMIT_CONFIG_YAML).write_text(_CONFIG)
+        monkeypatch.chdir(tmp_path)
+        assert _get_hooks() == [("setup-git", ["--python"]), ("setup-ruff", [])]
+        assert _get_hooks(hooks=["setup-ruff"]) == [("setup-ruff", [])]
+
+
+class TestRunFleet:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.delenv("PYTEST_VERSION")
+        repos = [tmp_path / "repo1", tmp_path / "repo2"]
+        for repo in repos:
+            repo.mkdir()
+            _ = (repo / PRE_COMMIT_CONFIG_YAML).write_text(_CONFIG)
+            monkeypatch.chdir(repo)
+            _ = run("git", "init", "-q")
+            _ = run("git", "add", ".")
+        monkeypatch.chdir(tmp_path)
+        for i in range(2):
+            results = run_fleet(*repos, hooks=["setup-git"])
+            assert [r.repo for r in results] == repos
+            expected = [] if i >= 1 else ["setup-git"]
+            assert all(r.modified == expected for r in results)
+            assert all(r.errors == {} for r in results)
+        gitignore = get_template("gitignore", python=True)
+        for repo in repos:
+            assert (repo / GITATTRIBUTES).is_file()
+            assert gitignore in (repo / GITIGNORE).read_text()
+
+    def test_missing_config(self, *, tmp_path: Path) -> None:
+        (result,) = run_fleet(tmp_path)
+        assert list(result.errors) == ["fleet"]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import sys
+from subprocess import check_output
+
+from pytest import mark, param
+
+_HEAVY = {"libcst", "orjson", "tomlkit", "yaml"}
+
+
+class TestImportTime:
+    @mark.parametrize(
+        "hook", [param("setup_git"), param("setup_just"), param("setup_readme")]
+    )
+    def test_main(self, *, hook: str) -> None:
+        code = f"import sys, pre_commit_hooks.hooks.{hook}; print(*sys.modules)"
+        output = check_output([sys.executable, "-c", code], text=True)
+        modules = {name.split(".")[0] for name in output.split()}
+        assert modules.isdisjoint(_HEAVY)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pre_commit_hooks.templates import get_template, list_templates
+
+
+class TestGetTemplate:
+    def test_cached(self) -> None:
+        assert get_template("gitignore", python=True) is get_template(
+            "gitignore", python=True
+        )
+
+    def test_readme_header(self) -> None:
+        result = get_template("readme-header", repo_name="repo", description="desc")
+        assert result == "# `repo`\n\ndesc"
+
+
+class TestListTemplates:
+    def test_main(self) -> None:
+        result = list_templates()
+        assert set(result) == {
+            "direnv-header",
+            "direnv-python",
+            "gitattributes",
+            "gitignore",
+            "justfile",
+            "readme-header",
+        }
+        assert result["readme-header"] == "# `<repo_name>`\n\n<description>"
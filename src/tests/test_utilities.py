@@ -1,15 +1,244 @@
 from __future__ import annotations
 
+import json
+import os
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
+from threading import get_ident
 from typing import TYPE_CHECKING
 
+import tomlkit
+import yaml
 from pytest import mark, param, raises
+from utilities.core import identity, normalize_multi_line_str, read_text
+from utilities.subprocess import run
+from utilities.version import Version2, Version3
 
+import pre_commit_hooks.utilities
 from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML
-from pre_commit_hooks.utilities import merge_paths
+from pre_commit_hooks.utilities import (
+    Tracker,
+    _freeze,
+    _get_yaml_dumper,
+    _group_by_paths,
+    _load_json,
+    _path_version_set_cache,
+    _read_version_set_cache,
+    _VersionSetCacheError,
+    _write_version_set_cache,
+    ensure_contains,
+    ensure_not_contains,
+    get_array,
+    get_pyproject_dependencies,
+    get_set_array,
+    get_table,
+    get_version_from_path,
+    get_version_origin_master,
+    is_dirty,
+    load_yaml,
+    merge_paths,
+    queue_prettier,
+    queue_taplo,
+    re_insert_table,
+    run_all,
+    run_all_maybe_raise,
+    run_cached,
+    run_formatters,
+    run_python_transforms,
+    set_version,
+    track,
+    update_toml_doc,
+    yield_document_cache,
+    yield_immutable_write_context,
+    yield_json_dict,
+    yield_text_file,
+    yield_toml_doc,
+    yield_yaml_dict,
+)
 
 if TYPE_CHECKING:
-    from utilities.types import MaybeSequence, PathLike
+    from pytest import MonkeyPatch
+    from tomlkit import TOMLDocument
+    from utilities.packaging import Requirement
+    from utilities.types import MaybeSequence, PathLike, StrDict
+
+    from pre_commit_hooks.types import FuncAndPaths
+
+
+class TestDocumentCache:
+    def test_toml(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.toml"
+        _ = path.write_text("a = 1\n")
+        modifications: set[Path] = set()
+        with yield_document_cache():
+            with yield_toml_doc(path, modifications=modifications) as doc1:
+                doc1["b"] = 2
+            with yield_toml_doc(path, modifications=modifications) as doc2:
+                assert doc2 is doc1
+                doc2["c"] = 3
+            assert path.read_text() == "a = 1\n"
+            assert modifications == {path}
+        assert path.read_text() == "a = 1\nb = 2\nc = 3\n"
+
+    def test_unchanged(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        _ = path.write_text("a:  1  # comment\n")
+        modifications: set[Path] = set()
+        with yield_document_cache():
+            for _ in range(2):
+                with yield_yaml_dict(path, modifications=modifications) as dict_:
+                    assert dict_ == {"a": 1}
+        assert modifications == set()
+        assert path.read_text() == "a:  1  # comment\n"
+
+    @mark.parametrize("documents", [param(True), param(False)])
+    def test_reorder_toml(self, *, tmp_path: Path, documents: bool) -> None:
+        path = tmp_path / "file.toml"
+        _ = path.write_text("[a]\nc = 1\nb = 2\n")
+        modifications: set[Path] = set()
+        with yield_document_cache() if documents else nullcontext():
+            with yield_toml_doc(path, modifications=modifications) as doc:
+                re_insert_table(get_table(doc, "a"))
+            with yield_toml_doc(path, modifications=modifications) as doc:
+                assert list(get_table(doc, "a")) == ["c", "b"]
+        assert modifications == set()
+        assert path.read_text() == "[a]\nc = 1\nb = 2\n"
+
+    @mark.parametrize("documents", [param(True), param(False)])
+    def test_reorder_yaml(self, *, tmp_path: Path, documents: bool) -> None:
+        path = tmp_path / "file.yaml"
+        _ = path.write_text("a: 1\nb: 2\n")
+        modifications: set[Path] = set()
+        with (
+            yield_document_cache() if documents else nullcontext(),
+            yield_yaml_dict(path, modifications=modifications) as dict_,
+        ):
+            dict_["a"] = dict_.pop("a")
+        assert modifications == set()
+        assert path.read_text() == "a: 1\nb: 2\n"
+
+    def test_error(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.toml"
+        _ = path.write_text("a = 1\n")
+        modifications: set[Path] = set()
+        with raises(ValueError, match="failed"), yield_document_cache():
+            with yield_toml_doc(path, modifications=modifications) as doc:
+                doc["b"] = 2
+            with yield_toml_doc(path, modifications=modifications) as doc:
+                doc["c"] = 3
+                msg = "failed"
+                raise ValueError(msg)
+        assert modifications == {path}
+        assert path.read_text() == "a = 1\nb = 2\n"
+
+    def test_hook(self, *, tmp_path: Path) -> None:
+        from pre_commit_hooks.hooks.setup_pyproject import _run
+
+        texts: list[str] = []
+        for documents in [False, True]:
+            path = tmp_path / str(documents) / "pyproject.toml"
+            path.parent.mkdir()
+            _ = path.write_text('[project]\nname = "name"\n')
+            for i in range(2):
+                with yield_document_cache() if documents else nullcontext():
+                    result = _run(path=path, description="description")
+                assert result is (i >= 1)
+            texts.append(path.read_text().replace(str(path.parent), ""))
+        assert texts[0] == texts[1]
+
+    def test_other_kind(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.toml"
+        with yield_document_cache():
+            with yield_toml_doc(path) as doc:
+                doc["a"] = 1
+            with yield_text_file(path) as context:
+                assert context.input == "a = 1\n"
+
+
+class TestEnsureContains:
+    def test_dicts(self) -> None:
+        container: list[StrDict] = [{"a": 1}, {"b": [1, 2]}, {"c": {3}}]
+        ensure_contains(
+            container, {"a": 1}, {"b": [1, 2]}, {"c": {3}}, {"d": 4}, {"d": 4}
+        )
+        assert container == [{"a": 1}, {"b": [1, 2]}, {"c": {3}}, {"d": 4}]
+
+    def test_strs(self) -> None:
+        container = ["a", "b"]
+        ensure_contains(container, "a", "c", "c")
+        assert container == ["a", "b", "c"]
+
+    def test_toml(self) -> None:
+        doc = tomlkit.parse('array = ["a", "b"]')
+        array = get_array(doc, "array")
+        ensure_contains(array, "a", "c")
+        assert array == ["a", "b", "c"]
+
+
+class TestEnsureNotContains:
+    def test_dicts(self) -> None:
+        container: list[StrDict] = [{"a": 1}, {"b": [1]}, {"a": 1}, {"c": {3}}]
+        ensure_not_contains(container, {"a": 1}, {"b": [1]}, {"c": {3}}, {"e": 5})
+        assert container == [{"a": 1}]
+
+    def test_strs(self) -> None:
+        container = ["a", "b", "a", "d"]
+        ensure_not_contains(container, "a", "b", "e")
+        assert container == ["a", "d"]
+
+
+class TestFreeze:
+    def test_equal(self) -> None:
+        doc = tomlkit.parse("[table]\nkey = [1, 2]")
+        assert _freeze(doc["table"]) == _freeze({"key": [1, 2]})
+
+
+class TestLoadJSON:
+    @mark.parametrize(
+        "text",
+        [
+            param('{"a": 1, "b": [1.5, "c", null, true]}'),
+            param('{"a": "\\u00e9", "b": {"c": []}}'),
+            param('{"a": NaN}'),
+            param('{"a": 123456789012345678901234567890}'),
+        ],
+    )
+    def test_parity(self, *, text: str) -> None:
+        assert repr(_load_json(text)) == repr(json.loads(text))
+
+    def test_round_trip(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        _ = path.write_text(json.dumps({"a": "\u00e9", "b": [1, 2.5]}))
+        with yield_json_dict(path) as dict_:
+            dict_["c"] = None
+        expected = json.dumps({"a": "\u00e9", "b": [1, 2.5], "c": None})
+        assert path.read_text() == f"{expected}\n"
+
+
+class TestLoadYAML:
+    @mark.parametrize(
+        "text",
+        [
+            param("a:\n  - b: 1\n    c: 'd'\n"),
+            param("a: 2024-01-01\nb: 1.0e+3\nc: ~\nd: yes\n"),
+            param("a: &x [1, 2]\nb: *x\nc: |\n  line\n  line\n"),
+            param(PRE_COMMIT_CONFIG_YAML.read_text()),
+        ],
+    )
+    def test_parity(self, *, text: str) -> None:
+        assert load_yaml(text) == yaml.safe_load(text)
+
+    def test_round_trip(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        text = PRE_COMMIT_CONFIG_YAML.read_text()
+        _ = path.write_text(text)
+        with yield_yaml_dict(path) as dict_:
+            dict_["z"] = 1
+        expected = yaml.safe_load(text) | {"z": 1}
+        assert path.read_text() == yaml.dump(
+            expected, Dumper=_get_yaml_dumper(), sort_keys=False
+        )
 
 
 class TestMergePaths:
@@ -42,3 +271,423 @@ class TestMergePaths:
     def test_error(self) -> None:
         with raises(ValueError, match=r"Invalid path; got 'path'"):
             _ = merge_paths("path", target="target")
+
+
+class TestPyProjectDependencies:
+    def test_map_requirements(self) -> None:
+        doc = tomlkit.parse(
+            normalize_multi_line_str("""
+                [project]
+                dependencies = ["b>=1", "a>=1"]
+
+                [project.optional-dependencies]
+                extra = ["a>=1"]
+            """)
+        )
+        calls: list[str] = []
+
+        def func(requirement: Requirement, /) -> Requirement:
+            calls.append(str(requirement))
+            return requirement.replace(">=", "2")
+
+        get_pyproject_dependencies(doc).map_requirements(func)
+        assert calls == ["b>=1", "a>=1"]
+        project = get_table(doc, "project")
+        assert get_array(project, "dependencies") == ["a>=2", "b>=2"]
+        optional = get_table(project, "optional-dependencies")
+        assert get_array(optional, "extra") == ["a>=2"]
+
+
+class TestRunAll:
+    @mark.parametrize("parallel", [param(True), param(False)])
+    def test_main(self, *, tmp_path: Path, parallel: bool) -> None:
+        calls: list[tuple[str, int]] = []
+
+        def func(*, path: Path, n: int, result: bool = True) -> bool:
+            calls.append((path.name, n))
+            return result
+
+        funcs: list[FuncAndPaths] = [
+            (partial(func, path=tmp_path / name, n=n), [tmp_path / name])
+            for n in range(5)
+            for name in ["a", "b"]
+        ]
+        assert run_all(*funcs, parallel=parallel)
+        for name in ["a", "b"]:
+            assert [n for name_i, n in calls if name_i == name] == list(range(5))
+
+    @mark.parametrize("parallel", [param(True), param(False)])
+    def test_failure(self, *, parallel: bool) -> None:
+        assert not run_all(lambda: True, lambda: False, parallel=parallel)
+
+    def test_unknown_serial(self) -> None:
+        threads: list[int] = []
+
+        def func() -> bool:
+            threads.append(get_ident())
+            return True
+
+        assert run_all(func, func, parallel=True)
+        assert threads == [get_ident(), get_ident()]
+
+    def test_group_by_paths(self, *, tmp_path: Path) -> None:
+        def func() -> bool:
+            return True
+
+        funcs = [partial(func) for _ in range(7)]
+        groups, unknown = _group_by_paths(
+            (funcs[0], [tmp_path / "a"]),
+            (funcs[1], [str(tmp_path / "a")]),
+            (funcs[2], [tmp_path / "b", tmp_path / "c"]),
+            (funcs[3], [tmp_path / "c"]),
+            (funcs[4], [tmp_path / "d"]),
+            (funcs[5], []),
+            funcs[6],
+        )
+        assert groups == [funcs[:2], funcs[2:4], funcs[4:5]]
+        assert unknown == funcs[5:]
+
+
+class TestRunCached:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        _ = path.write_text("text")
+        calls: list[None] = []
+
+        def func() -> bool:
+            calls.append(None)
+            return True
+
+        for _ in range(3):
+            assert run_cached(func, name="name", path=path, root=tmp_path / "cache")
+        assert len(calls) == 1
+        _ = path.write_text("new text")
+        assert run_cached(func, name="name", path=path, root=tmp_path / "cache")
+        assert len(calls) == 2
+
+    def test_failure_not_cached(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        _ = path.write_text("text")
+        for _ in range(2):
+            assert not run_cached(
+                lambda: False, name="name", path=path, root=tmp_path / "cache"
+            )
+        assert not (tmp_path / "cache").exists()
+
+    def test_eviction(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        root = tmp_path / "cache"
+        for i in range(5):
+            _ = path.write_text(str(i))
+            _ = run_cached(
+                lambda: True, name="name", path=path, root=root, max_entries=3
+            )
+        assert len(list(root.iterdir())) == 3
+
+    def test_disabled(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        _ = path.write_text("text")
+        root = tmp_path / "cache"
+        assert run_cached(lambda: True, name="name", path=path, root=root, cache=False)
+        assert not root.exists()
+
+
+class TestRunFormatters:
+    def test_main(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        calls = self._record(monkeypatch)
+        paths = [tmp_path / "a.yaml", tmp_path / "b.toml"]
+        for path in paths:
+            _ = path.write_text("")
+        for _ in range(2):
+            queue_prettier(paths[0])
+            queue_prettier(str(paths[0]))
+            queue_taplo(paths[1])
+        queue_prettier(tmp_path / "missing.yaml")
+        run_formatters()
+        assert calls == [("prettier", (paths[0],)), ("taplo", (paths[1],))]
+        calls.clear()
+        run_formatters()
+        assert calls == []
+
+    def test_error(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        calls = self._record(monkeypatch)
+        path = tmp_path / "a.yaml"
+
+        def write() -> bool:
+            _ = path.write_text("")
+            queue_prettier(path)
+            return True
+
+        def fail() -> bool:
+            msg = "failed"
+            raise ValueError(msg)
+
+        with raises(ValueError, match="failed"):
+            run_all_maybe_raise(write, fail)
+        assert calls == [("prettier", (path,))]
+        calls.clear()
+        run_formatters()
+        assert calls == []
+
+    def _record(
+        self, monkeypatch: MonkeyPatch, /
+    ) -> list[tuple[str, tuple[PathLike, ...]]]:
+        calls: list[tuple[str, tuple[PathLike, ...]]] = []
+
+        def record(name: str, /, *paths: PathLike) -> None:
+            calls.append((name, paths))
+
+        for name in ["prettier", "taplo"]:
+            monkeypatch.setattr(
+                pre_commit_hooks.utilities, f"run_{name}", partial(record, name)
+            )
+        return calls
+
+
+class TestRunPythonTransforms:
+    @mark.parametrize("max_workers", [param(1), param(2)])
+    def test_main(self, *, tmp_path: Path, max_workers: int) -> None:
+        from pre_commit_hooks.hooks import (
+            add_future_import_annotations,
+            replace_sequence_str,
+        )
+
+        paths = [tmp_path / f"file{i}.py" for i in range(4)]
+        for path in paths[:2]:
+            _ = path.write_text("x: Sequence[str]\n")
+        modifications: set[Path] = set()
+        run_python_transforms(
+            *paths,
+            transforms=[
+                add_future_import_annotations.TRANSFORM,
+                replace_sequence_str.TRANSFORM,
+            ],
+            modifications=modifications,
+            max_workers=max_workers,
+            min_batch=1,
+        )
+        assert modifications == set(paths)
+        for path in paths[:2]:
+            assert path.read_text() == "x: list[str]\n"
+        for path in paths[2:]:
+            assert path.read_text() == "from __future__ import annotations\n"
+
+
+class TestSetVersion:
+    def test_main(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        _ = Path(".bumpversion.toml").write_text(
+            normalize_multi_line_str("""
+                [tool.bumpversion]
+                current_version = "1.2.3"
+
+                # first released as 1.2.3
+                [[tool.bumpversion.files]]
+                filename = "pyproject.toml"
+                search = "version = \\"{current_version}\\""
+                replace = "version = \\"{new_version}\\""
+            """)
+        )
+        _ = Path("pyproject.toml").write_text('version = "1.2.3"\nother = "1.2.3"\n')
+        set_version(Version3(1, 2, 4))
+        assert get_version_from_path(cache=False) == Version3(1, 2, 4)
+        assert "# first released as 1.2.3\n" in read_text(".bumpversion.toml")
+        assert read_text("pyproject.toml") == 'version = "1.2.4"\nother = "1.2.3"\n'
+
+    def test_error(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        _ = Path(".bumpversion.toml").write_text(
+            normalize_multi_line_str("""
+                [tool.bumpversion]
+                current_version = "1.2.3"
+
+                [[tool.bumpversion.files]]
+                filename = "pyproject.toml"
+                search = "version = \\"{current_version}\\""
+                replace = "version = \\"{new_version}\\""
+            """)
+        )
+        _ = Path("pyproject.toml").write_text('version = "1.2.2"\n')
+        with raises(ValueError, match=r"Unable to find 'version = \"1\.2\.3\"'"):
+            set_version(Version3(1, 2, 4))
+        assert get_version_from_path(cache=False) == Version3(1, 2, 3)
+
+
+class TestTrack:
+    def test_unchanged(self) -> None:
+        tracker = Tracker()
+        obj = track({"a": 1, "b": [{"c": 2}]}, tracker)
+        obj["a"] = 1
+        obj["b"][0]["c"] = 2
+        obj.setdefault("a", 3)
+        assert not is_dirty(obj)
+        assert tracker.changes == []
+
+    def test_changed(self) -> None:
+        tracker = Tracker()
+        obj = track({"a": 1, "b": [{"c": 2}]}, tracker)
+        obj["b"][0]["c"] = 3
+        obj["b"].append(4)
+        del obj["a"]
+        assert is_dirty(obj)
+        assert tracker.changes == ["set 'c'", "append 1", "delete 'a'"]
+
+    def test_untracked(self) -> None:
+        assert is_dirty({})
+
+    def test_yaml_dict(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        _ = path.write_text("a:\n  - b: 1\n")
+        modifications: set[Path] = set()
+        with yield_yaml_dict(path, modifications=modifications) as dict_:
+            dict_["a"][0]["b"] = 1
+        assert modifications == set()
+        with yield_yaml_dict(path, modifications=modifications) as dict_:
+            dict_["a"][0]["b"] = 2
+        assert modifications == {path}
+        assert path.read_text() == "a:\n- b: 2\n"
+
+
+class TestGetVersionFromPath:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / ".bumpversion.toml"
+        _ = path.write_text('[tool.bumpversion]\ncurrent_version = "1.2.3"\n')
+        root = tmp_path / "cache"
+        assert get_version_from_path(path=path, root=root) == Version3(1, 2, 3)
+        stat = path.stat()
+        _ = path.write_text('[tool.bumpversion]\ncurrent_version = "1.2.4"\n')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert get_version_from_path(path=path, root=root) == Version3(1, 2, 4)
+        assert get_version_from_path(path=path, root=root) == Version3(1, 2, 4)
+        assert len(list(root.iterdir())) == 2
+
+
+class TestGetVersionOriginMaster:
+    def test_main(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        _ = run("git", "init", "-q")
+        _ = Path(".bumpversion.toml").write_text(
+            '[tool.bumpversion]\ncurrent_version = "1.2.3"\n'
+        )
+        _ = run("git", "add", ".bumpversion.toml")
+        _ = run(
+            "git",
+            "-c",
+            "user.name=name",
+            "-c",
+            "user.email=email",
+            "commit",
+            "-q",
+            "-m",
+            "message",
+        )
+        _ = run("git", "update-ref", "refs/remotes/origin/master", "HEAD")
+        root = tmp_path / "cache"
+        assert get_version_origin_master(root=root) == Version3(1, 2, 3)
+        assert len(list(root.iterdir())) == 1
+        assert get_version_origin_master(root=root) == Version3(1, 2, 3)
+
+    def test_error(self, *, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        _ = run("git", "init", "-q")
+        with raises(ValueError, match=r"Unable to get the version of origin/master"):
+            _ = get_version_origin_master(root=tmp_path / "cache")
+
+
+class TestUpdateTOMLDoc:
+    @mark.parametrize(
+        ("text", "expected"),
+        [
+            param('a = 1\nb = ["x", "y"]\n', True),
+            param('a  =  1  # comment\nb = ["x","y"]\n', True),
+            param('a = 2\nb = ["x", "y"]\n', False),
+            param('a = 1\nb = ["x"]\n', False),
+            param("a = 1\n", False),
+        ],
+    )
+    def test_main(self, *, tmp_path: Path, text: str, expected: bool) -> None:
+        path = tmp_path / "file.toml"
+        _ = path.write_text(text)
+        modifications: set[Path] = set()
+
+        def func(doc: TOMLDocument, /) -> None:
+            doc["a"] = 1
+            ensure_contains(get_set_array(doc, "b"), "x", "y")
+
+        update_toml_doc(path, func, modifications=modifications)
+        assert (len(modifications) == 0) is expected
+        if expected:
+            assert path.read_text() == text
+        else:
+            assert tomlkit.parse(path.read_text()) == {"a": 1, "b": ["x", "y"]}
+
+    def test_error(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.toml"
+        _ = path.write_text("a = 1\n")
+
+        calls: list[TOMLDocument] = []
+
+        def func(doc: TOMLDocument, /) -> None:
+            calls.append(doc)
+            msg = "failed"
+            raise ValueError(msg)
+
+        with raises(ValueError, match="failed"):
+            update_toml_doc(path, func)
+        assert len(calls) == 1
+        assert path.read_text() == "a = 1\n"
+
+
+class TestVersionSetCache:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "cache.json"
+        versions = {"package1": Version2(1, 2), "package2": Version3(1, 2, 3)}
+        _write_version_set_cache(path, versions)
+        assert _read_version_set_cache(path) == versions
+
+    def test_expired(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "cache.json"
+        _write_version_set_cache(path, {"package": Version2(1, 2)})
+        with raises(_VersionSetCacheError):
+            _ = _read_version_set_cache(path, ttl=-1)
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        with raises(_VersionSetCacheError):
+            _ = _read_version_set_cache(tmp_path / "cache.json")
+
+    def test_key(self) -> None:
+        path1 = _path_version_set_cache("[]", index="https://pypi.org/simple")
+        path2 = _path_version_set_cache("[]", index="https://example.com/simple")
+        path3 = _path_version_set_cache("[]", index_username="username")
+        assert len({path1, path2, path3}) == 3
+
+
+class TestYieldImmutableWriteContext:
+    def test_single_parse(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        _ = path.write_text("text\n")
+        loads: list[str] = []
+
+        def parse(text: str, /) -> str:
+            loads.append(text)
+            return text
+
+        modifications: set[Path] = set()
+        with yield_immutable_write_context(
+            path, parse, str, str, modifications=modifications, copy=identity
+        ) as context:
+            assert context.output is context.input
+        assert loads == ["text\n"]
+        assert modifications == set()
+
+    def test_output_is_input(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        _ = path.write_text("text\n")
+        modifications: set[Path] = set()
+        with yield_text_file(path, modifications=modifications) as context:
+            context.output = context.input
+        assert modifications == set()
+        with yield_text_file(path, modifications=modifications) as context:
+            context.output = "other"
+        assert modifications == {path}
+        assert path.read_text() == "other\n"